@@ -6,8 +6,14 @@ from typing import Annotated
 
 import typer
 
-from protspace.cli.app import PANEL_STAGES, app, setup_logging
-from protspace.cli.common_options import Opt_Verbose
+from protspace.cli.app import (
+    PANEL_STAGES,
+    app,
+    setup_logging,
+    split_csv_option,
+    validate_annotation_names,
+)
+from protspace.cli.common_options import ANNOTATIONS_HELP, Opt_Verbose
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +34,7 @@ def annotate(
         typer.Option(
             "-a",
             "--annotations",
-            help="Annotation sources (repeatable): default, all, uniprot, interpro, taxonomy, or individual names.",
+            help=f"{ANNOTATIONS_HELP}. Repeatable.",
         ),
     ] = None,
     output: Annotated[
@@ -51,6 +57,20 @@ def annotate(
     """
     setup_logging(verbose)
 
+    from protspace.data.processors.pipeline import ANNOTATION_FILE_SUFFIXES
+
+    # Reject annotation files before reading any input; suffix check only
+    names = split_csv_option(annotations) if annotations else []
+    files = [n for n in names if n.lower().endswith(ANNOTATION_FILE_SUFFIXES)]
+    if files:
+        raise typer.BadParameter(
+            f"annotate fetches annotations by name; got file(s) {', '.join(files)}. "
+            "Use 'protspace prepare -a FILE' to merge custom annotations.",
+            param_hint="--annotations",
+        )
+    # Unknown names fail here too, before the input is read
+    annotations_list = validate_annotation_names(names) if names else None
+
     import h5py
     import pyarrow as pa
     import pyarrow.parquet as pq
@@ -81,20 +101,6 @@ def annotate(
 
     logger.info(f"Found {len(headers)} protein identifiers")
 
-    # Resolve annotation names
-    annotations_list = None
-    if annotations:
-        from protspace.data.annotations.configuration import AnnotationConfiguration
-
-        names = []
-        for item in annotations:
-            for part in item.split(","):
-                part = part.strip()
-                if part:
-                    names.append(part)
-        if names:
-            annotations_list = AnnotationConfiguration(names).user_annotations
-
     # Fetch annotations
     df = ProteinAnnotationManager(
         headers=headers,
@@ -74,6 +74,28 @@ def setup_logging(verbosity: int) -> None:
         logging.getLogger(name).setLevel(logging.WARNING)
 
 
+def split_csv_option(values: list[str]) -> list[str]:
+    """Flatten a repeatable, comma-separated option into its non-empty tokens.
+
+    ``["pca2,umap2", " tsne2 "]`` → ``["pca2", "umap2", "tsne2"]``.
+    """
+    return [part for item in values for part in map(str.strip, item.split(",")) if part]
+
+
+def validate_annotation_names(names: list[str]) -> list[str]:
+    """Resolve annotation and group names, failing fast as a CLI error.
+
+    Returns the expanded annotation list. Unknown names raise
+    ``typer.BadParameter`` before any input is read or work is started.
+    """
+    from protspace.data.annotations.configuration import AnnotationConfiguration
+
+    try:
+        return AnnotationConfiguration(names).user_annotations
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="-a/--annotations") from e
+
+
 # ---------------------------------------------------------------------------
 # Register subcommands (imported lazily to keep startup fast)
 # ---------------------------------------------------------------------------
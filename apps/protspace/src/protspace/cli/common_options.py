@@ -31,6 +31,26 @@ class Backend(StrEnum):
     local = "local"  # on-device GPU/CPU via transformers ([local] extra)
 
 
+# ---------------------------------------------------------------------------
+# Shared help text
+# ---------------------------------------------------------------------------
+
+# Built once at import; commands append only their small per-command variant
+# (e.g. prepare's CSV/TSV note) instead of re-spelling the group list.
+ANNOTATIONS_URL = (
+    "https://github.com/tsenoner/protspace/blob/main/apps/protspace/docs/annotations.md"
+)
+ANNOTATIONS_HELP = (
+    "Annotation groups (default,all,uniprot,interpro,taxonomy,ted,biocentral) "
+    "or individual names"
+)
+EMBEDDER_MODELS_HELP = (
+    "Models: prot_t5, prost_t5, esm2_8m, esm2_35m, esm2_150m, "
+    "esm2_650m, esm2_3b, ankh_base, ankh_large, ankh3_large, "
+    "esmc_300m, esmc_600m."
+)
+EMBEDDER_LICENSE_HELP = "Note: ankh_*, ankh3_*, esmc_600m are non-commercial licenses."
+
 # ---------------------------------------------------------------------------
 # Shared option types
 # ---------------------------------------------------------------------------
@@ -131,6 +151,19 @@ Opt_Eps = Annotated[
     float,
     typer.Option(help="MDS convergence tolerance.", rich_help_panel="Projection"),
 ]
+Opt_Jobs = Annotated[
+    int,
+    typer.Option(
+        "-j",
+        "--jobs",
+        min=1,
+        help=(
+            "Run up to N reductions in parallel worker processes (capped at the "
+            "CPU count). Workers share one copy of the embeddings."
+        ),
+        rich_help_panel="Projection",
+    ),
+]
 
 # Embedding options (shared by prepare and embed)
 Opt_Backend = Annotated[
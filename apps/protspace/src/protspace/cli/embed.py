@@ -8,6 +8,8 @@ import typer
 
 from protspace.cli.app import PANEL_STAGES, app, setup_logging
 from protspace.cli.common_options import (
+    EMBEDDER_LICENSE_HELP,
+    EMBEDDER_MODELS_HELP,
     Backend,
     Opt_Backend,
     Opt_BatchSize,
@@ -35,10 +37,7 @@ def embed(
             "--embedder",
             help=(
                 "Biocentral model shortcut (repeatable for multi-model).\n"
-                "Models: prot_t5, prost_t5, esm2_8m, esm2_35m, esm2_150m, "
-                "esm2_650m, esm2_3b, ankh_base, ankh_large, ankh3_large, "
-                "esmc_300m, esmc_600m.\n"
-                "Note: ankh_*, ankh3_*, esmc_600m are non-commercial licenses."
+                f"{EMBEDDER_MODELS_HELP}\n{EMBEDDER_LICENSE_HELP}"
             ),
         ),
     ],
@@ -17,8 +17,18 @@ if TYPE_CHECKING:
 
 import typer
 
-from protspace.cli.app import PANEL_START, app, setup_logging
+from protspace.cli.app import (
+    PANEL_START,
+    app,
+    setup_logging,
+    split_csv_option,
+    validate_annotation_names,
+)
 from protspace.cli.common_options import (
+    ANNOTATIONS_HELP,
+    ANNOTATIONS_URL,
+    EMBEDDER_LICENSE_HELP,
+    EMBEDDER_MODELS_HELP,
     Backend,
     ClusterSelection,
     Metric,
@@ -27,6 +37,7 @@ from protspace.cli.common_options import (
     Opt_Eps,
     Opt_Fasta,
     Opt_FpRatio,
+    Opt_Jobs,
     Opt_LearningRate,
     Opt_MaxIter,
     Opt_Methods,
@@ -43,9 +54,6 @@ from protspace.cli.common_options import (
 
 logger = logging.getLogger(__name__)
 
-ANNOTATIONS_URL = (
-    "https://github.com/tsenoner/protspace/blob/main/apps/protspace/docs/annotations.md"
-)
 EMBEDDER_MODELS = {
     "prot_t5",
     "prost_t5",
@@ -94,10 +102,7 @@ Opt_Embedder = Annotated[
         "--embedder",
         help=(
             "pLM model(s), comma-separated. "
-            "Models: prot_t5, prost_t5, esm2_8m, esm2_35m, esm2_150m, "
-            "esm2_650m, esm2_3b, ankh_base, ankh_large, ankh3_large, "
-            "esmc_300m, esmc_600m. "
-            "Note: ankh_*, ankh3_*, esmc_600m are non-commercial licenses."
+            f"{EMBEDDER_MODELS_HELP} {EMBEDDER_LICENSE_HELP}"
         ),
         rich_help_panel="Embedding",
     ),
@@ -109,7 +114,7 @@ Opt_Annotations = Annotated[
     typer.Option(
         "-a",
         "--annotations",
-        help=f"Annotation groups (default,all,uniprot,interpro,taxonomy,ted,biocentral), individual names, or a CSV/TSV file path. Repeatable. See {ANNOTATIONS_URL}",
+        help=f"{ANNOTATIONS_HELP}, or a CSV/TSV file path. Repeatable. See {ANNOTATIONS_URL}",
         rich_help_panel="Annotations",
     ),
 ]
@@ -213,6 +218,17 @@ Opt_DumpCache = Annotated[
         rich_help_panel="Output",
     ),
 ]
+Opt_DumpColumns = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--dump-columns",
+        help=(
+            "With --dump-cache, print only these columns (comma-separated, "
+            "repeatable). Only they are read from disk."
+        ),
+        rich_help_panel="Output",
+    ),
+]
 Opt_NoLog = Annotated[
     bool,
     typer.Option(
@@ -250,6 +266,40 @@ def _parse_refetch(raw: str | None) -> frozenset[str]:
     return frozenset(stages)
 
 
+def _dump_cache(
+    cache_path: Path, columns: list[str] | None = None, batch_size: int = 65_536
+) -> None:
+    """Stream a cached annotation parquet to stdout as CSV, one batch at a time.
+
+    Peak memory is one record batch, not the whole table plus its CSV text.
+    With ``columns``, only those column chunks are read from disk.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(cache_path)
+    if columns:
+        unknown = [c for c in columns if c not in parquet.schema_arrow.names]
+        if unknown:
+            raise typer.BadParameter(
+                f"Not in the annotation cache: {', '.join(unknown)}",
+                param_hint="--dump-columns",
+            )
+    batches = parquet.iter_batches(batch_size=batch_size, columns=columns)
+    for i, batch in enumerate(batches):
+        # Arrow-backed dtypes keep formatting stable across batches (an int
+        # column with nulls in one batch only would otherwise print as float)
+        frame = batch.to_pandas(types_mapper=pd.ArrowDtype)
+        frame.to_csv(sys.stdout, index=False, header=i == 0)
+    if parquet.metadata.num_rows == 0:
+        # No batches: still print the header, as the whole-table path did
+        schema = parquet.schema_arrow
+        if columns:
+            schema = pa.schema([schema.field(c) for c in columns])
+        schema.empty_table().to_pandas().to_csv(sys.stdout, index=False)
+
+
 def _embed_all(
     embedders: list[str],
     fasta_path: Path,
@@ -324,6 +374,7 @@ def prepare(
     n_init: Opt_NInit = 4,
     max_iter: Opt_MaxIter = 300,
     eps: Opt_Eps = 1e-3,
+    jobs: Opt_Jobs = 1,
     # Annotations
     annotations: Opt_Annotations = None,
     scores: Opt_Scores = True,
@@ -336,6 +387,7 @@ def prepare(
     keep_tmp: Opt_KeepTmp = True,
     bundled: Opt_Bundled = True,
     dump_cache: Opt_DumpCache = False,
+    dump_columns: Opt_DumpColumns = None,
     no_log: Opt_NoLog = False,
     # General
     verbose: Opt_Verbose = 0,
@@ -367,10 +419,40 @@ def prepare(
 
     refetch_stages = _parse_refetch(refetch)
     if refetch_stages:
-        logger.info(f"Refetching stages: {', '.join(sorted(refetch_stages))}")
+        logger.info("Refetching stages: %s", ", ".join(sorted(refetch_stages)))
 
     input_specs = _parse_input_specs(input) if input else []
 
+    # Parse and validate the method list before any heavy import, embedding,
+    # annotation fetch, or reduction work, so typos surface immediately.
+    from protspace.data.processors.pipeline import (
+        drop_unknown_methods,
+        parse_methods_arg,
+    )
+
+    try:
+        method_specs = drop_unknown_methods(parse_methods_arg(methods or ["pca2"]))
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="-m/--methods") from e
+
+    # Same for -a: unknown names and missing annotation files fail here rather
+    # than after embedding and reduction have run.
+    from protspace.data.processors.pipeline import ANNOTATION_FILE_SUFFIXES
+
+    annotation_list = split_csv_option(annotations or ["default"])
+    annotation_files = [
+        a for a in annotation_list if a.lower().endswith(ANNOTATION_FILE_SUFFIXES)
+    ]
+    missing = [f for f in annotation_files if not Path(f).is_file()]
+    if missing:
+        raise typer.BadParameter(
+            f"Annotation file not found: {', '.join(missing)}",
+            param_hint="-a/--annotations",
+        )
+    annotation_names = [a for a in annotation_list if a not in annotation_files]
+    if annotation_names:
+        validate_annotation_names(annotation_names)
+
     from protspace.data.io.fasta import is_fasta_file
 
     has_fasta = any(
@@ -386,7 +468,7 @@ def prepare(
         from protspace.data.embedding.biocentral import DEFAULT_EMBEDDER
 
         embedders = [DEFAULT_EMBEDDER]
-        logger.info(f"FASTA detected, defaulting to '{embedders[0]}'")
+        logger.info("FASTA detected, defaulting to '%s'", embedders[0])
 
     # --- Output and cache paths ---
     output_dir = output if output.suffix == "" else output.parent
@@ -411,12 +493,10 @@ def prepare(
             logger.error("No cache. Use --keep-tmp.")
             raise typer.Exit(1)
         cache_path = cache_dir / "all_annotations.parquet"
-        if cache_path.exists():
-            import pandas as pd
-
-            typer.echo(pd.read_parquet(cache_path).to_csv(index=False))
-        else:
-            logger.error(f"No cache at {cache_path}.")
+        try:
+            _dump_cache(cache_path, columns=split_csv_option(dump_columns) or None)
+        except FileNotFoundError:
+            logger.error("No cache at %s.", cache_path)
         return
 
     # --- Build embedding sets ---
@@ -462,7 +542,11 @@ def prepare(
                 )
                 fasta_path = fasta_save
             else:
-                headers, fasta_path = query_uniprot(query, save_to=fasta_save)
+                headers, fasta_path = query_uniprot(
+                    query,
+                    save_to=fasta_save,
+                    use_cache="query" not in refetch_stages,
+                )
             if not headers:
                 raise typer.BadParameter(f"No sequences for query: '{query}'")
 
@@ -489,7 +573,7 @@ def prepare(
                         f for ext in EMBEDDING_EXTENSIONS for f in path.glob(f"*{ext}")
                     )
                     if not h5s:
-                        logger.warning(f"No embedding files in: {path}")
+                        logger.warning("No embedding files in: %s", path)
                         continue
                     embedding_sets.append(load_h5(h5s, name_override=name_override))
                 elif path.suffix.lower() in EMBEDDING_EXTENSIONS:
@@ -532,25 +616,13 @@ def prepare(
                 )
             )
 
-        # --- Parse annotations (repeatable option → flat list) ---
-        raw = annotations if annotations else ["default"]
-        annotation_list = []
-        for item in raw:
-            for part in item.split(","):
-                part = part.strip()
-                if part:
-                    annotation_list.append(part)
-
         # --- Run pipeline ---
         from protspace.data.processors.pipeline import (
             PipelineConfig,
             ReducerParams,
             ReductionPipeline,
-            parse_methods_arg,
         )
 
-        method_specs = parse_methods_arg(methods or ["pca2"])
-
         reducer_params = ReducerParams(
             metric=metric.value,
             random_state=random_state,
@@ -577,6 +649,7 @@ def prepare(
             annotations=annotation_list,
             intermediate_dir=cache_dir,
             reducer_params=reducer_params,
+            max_workers=jobs,
         )
 
         ReductionPipeline(config).run(embedding_sets)
@@ -730,6 +803,6 @@ def _write_run_log(
             text = "\n---\n\n" + text
         with open(log_path, "a") as f:
             f.write(text)
-        logger.info(f"Run log written to {log_path}")
+        logger.info("Run log written to %s", log_path)
     except OSError:
-        logger.warning(f"Could not write run log to {log_path}")
+        logger.warning("Could not write run log to %s", log_path)
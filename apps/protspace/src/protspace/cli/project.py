@@ -11,6 +11,7 @@ from protspace.cli.common_options import (
     Metric,
     Opt_Eps,
     Opt_FpRatio,
+    Opt_Jobs,
     Opt_LearningRate,
     Opt_MaxIter,
     Opt_Methods,
@@ -70,6 +71,7 @@ def project(
     n_init: Opt_NInit = 4,
     max_iter: Opt_MaxIter = 300,
     eps: Opt_Eps = 1e-3,
+    jobs: Opt_Jobs = 1,
     verbose: Opt_Verbose = 0,
 ) -> None:
     """Embeddings → 2D projections (UMAP, t-SNE, PCA, …).
@@ -90,13 +92,19 @@ def project(
     from protspace.data.processors.base_processor import BaseProcessor
     from protspace.data.processors.pipeline import (
         ReducerParams,
-        _run_with_overridden_config,
+        _run_reduction_batch,
         disambiguation_suffix,
+        drop_unknown_methods,
         parse_methods_arg,
     )
     from protspace.utils import get_reducers
     from protspace.utils.constants import MDS_NAME
 
+    # Validate the method list before loading embeddings or running MMseqs2.
+    method_specs = parse_methods_arg(methods or ["pca2"])
+    reducers = get_reducers()
+    method_specs = drop_unknown_methods(method_specs, reducers)
+
     input_specs = _parse_input_specs(input)
     embedding_sets: list[EmbeddingSet] = []
 
@@ -114,8 +122,6 @@ def project(
 
     from dataclasses import asdict
 
-    method_specs = parse_methods_arg(methods or ["pca2"])
-
     reducer_params = ReducerParams(
         metric=metric.value,
         random_state=random_state,
@@ -130,7 +136,6 @@ def project(
         eps=eps,
     )
     global_params = asdict(reducer_params)
-    reducers = get_reducers()
     base = BaseProcessor(global_params, reducers)
 
     # Pre-compute which (method, dims) pairs appear multiple times
@@ -139,6 +144,8 @@ def project(
     all_reductions = []
     headers = embedding_sets[0].headers
     for emb_set in embedding_sets:
+        specs = []
+        batch = []
         for spec in method_specs:
             method, dims = spec.method, spec.dims
             if emb_set.precomputed and method != MDS_NAME:
@@ -146,22 +153,20 @@ def project(
                     f"Skipping {method} for '{emb_set.name}' (only MDS for precomputed)"
                 )
                 continue
-            if method not in reducers:
-                logger.warning(f"Unknown method: {method}. Skipping.")
-                continue
-
             effective_params = {**global_params, **spec.overrides_dict}
             if emb_set.precomputed:
                 effective_params["precomputed"] = True
+            specs.append(spec)
+            batch.append((method, dims, effective_params))
 
-            logger.info(f"Applying {method.upper()}{dims} to '{emb_set.name}'")
-            reduction = _run_with_overridden_config(
-                base, effective_params, method, dims, emb_set.data
-            )
+        reductions = _run_reduction_batch(
+            base, emb_set.data, batch, label=emb_set.name, max_workers=jobs
+        )
+        for spec, reduction in zip(specs, reductions, strict=True):
             reduction["name"] = format_projection_name(
                 emb_set.name,
-                method,
-                dims,
+                spec.method,
+                spec.dims,
                 disambiguation_suffix(spec, method_counts),
             )
             reduction["source"] = emb_set.name
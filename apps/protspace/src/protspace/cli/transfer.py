@@ -11,8 +11,6 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, get_args
 
-import numpy as np
-import pyarrow as pa
 import typer
 
 from protspace.cli.app import PANEL_REFINE, app, setup_logging
@@ -21,6 +19,9 @@ from protspace.core.constants import MISSING_VALUE_TOKENS
 from protspace.utils.constants import METRIC_TYPES
 
 if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
     from protspace.analysis.classification import Rule
 
 logger = logging.getLogger(__name__)
@@ -52,6 +53,9 @@ def run_transfer(
     ``embeddings`` maps protein id -> 1-D float32 vector. Proteins without an
     embedding cannot act as queries or references.
     """
+    import numpy as np
+    import pyarrow as pa
+
     from protlabel import eat
     from protspace.analysis.classification import classify
     from protspace.data.io.predictions import add_overlay_columns
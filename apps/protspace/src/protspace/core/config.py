@@ -48,8 +48,10 @@ def _marker_shapes_2d():
             "MARKER_SHAPES_2D requires plotly: pip install 'protspace[frontend]'"
         ) from exc
 
+    # Computed once per process; a tuple so no caller can mutate the shared
+    # cached value. Not shipped as a literal: the symbol set follows plotly.
     validator = ValidatorCache.get_validator("scatter.marker", "symbol")
-    return sorted(extract_marker_strings(validator.values))
+    return tuple(sorted(extract_marker_strings(validator.values)))
 
 
 def __getattr__(name):
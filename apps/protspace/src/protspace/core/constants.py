@@ -1,6 +1,11 @@
-import pandas as pd
+from __future__ import annotations
 
-from protspace.utils.arrow_reader import ArrowReader
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from protspace.utils.arrow_reader import ArrowReader
 
 # Raw string forms treated as missing across the codebase (before normalisation
 # to the "<N/A>" display sentinel). Shared so downstream consumers (e.g. the stats
@@ -10,10 +15,20 @@ MISSING_VALUE_TOKENS = ("", "nan", "none", "null", "NA", "NaN")
 
 def standardize_missing(series: pd.Series) -> pd.Series:
     """Replaces various forms of missing values with '<N/A>' in a pandas Series."""
-    series = series.astype(str)
-    replacements = dict.fromkeys(MISSING_VALUE_TOKENS, "<N/A>")
+    import numpy as np
+    import pandas as pd
 
-    return series.replace(replacements).fillna("<N/A>")
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Normalise the (few) categories, then expand through the codes; code
+        # -1 (missing) indexes the appended sentinel.
+        labels = standardize_missing(pd.Series(series.cat.categories)).to_numpy()
+        values = np.append(labels, "<N/A>")[series.cat.codes.to_numpy()]
+        return pd.Series(values, index=series.index, name=series.name, dtype=str)
+
+    series = series.astype(str)
+    # One hashed isin pass instead of one replace pass per token
+    missing = series.isna() | series.isin(MISSING_VALUE_TOKENS)
+    return series.mask(missing, "<N/A>")
 
 
 def is_projection_3d(reader: ArrowReader, projection_name: str) -> bool:
@@ -2,26 +2,33 @@
 ProtSpace data module.
 
 This module provides data processing, annotation extraction, and I/O functionality.
+
+Exports are resolved lazily so importing a submodule (e.g. the pipeline's
+method-spec parser) does not pull in pandas and every annotation retriever.
 """
 
-from protspace.data.annotations import (  # Annotations
-    AnnotationConfiguration,
-    AnnotationMerger,
-    ProteinAnnotationManager,
-)
-from protspace.data.processors import (  # Processors
-    BaseProcessor,
-    PipelineConfig,
-    ReductionPipeline,
-)
-
-__all__ = [
+_EXPORTS = {
     # Processors
-    "BaseProcessor",
-    "PipelineConfig",
-    "ReductionPipeline",
+    "BaseProcessor": "protspace.data.processors",
+    "PipelineConfig": "protspace.data.processors",
+    "ReductionPipeline": "protspace.data.processors",
     # Annotations
-    "ProteinAnnotationManager",
-    "AnnotationConfiguration",
-    "AnnotationMerger",
-]
+    "ProteinAnnotationManager": "protspace.data.annotations",
+    "AnnotationConfiguration": "protspace.data.annotations",
+    "AnnotationMerger": "protspace.data.annotations",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(_EXPORTS)
+
+
+__all__ = list(_EXPORTS)
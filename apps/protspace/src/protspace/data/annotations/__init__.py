@@ -5,10 +5,28 @@ This module handles protein annotation extraction, transformation, and processin
 - ProteinAnnotationManager: Main orchestrator for annotation extraction workflow
 - AnnotationConfiguration: Annotation validation and configuration
 - AnnotationMerger: Merges annotations from multiple sources
+
+Exports are resolved lazily so that validating annotation names (which only
+needs the configuration module) does not import the retrievers.
 """
 
-from protspace.data.annotations.configuration import AnnotationConfiguration
-from protspace.data.annotations.manager import ProteinAnnotationManager
-from protspace.data.annotations.merging import AnnotationMerger
+_EXPORTS = {
+    "ProteinAnnotationManager": "protspace.data.annotations.manager",
+    "AnnotationConfiguration": "protspace.data.annotations.configuration",
+    "AnnotationMerger": "protspace.data.annotations.merging",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(_EXPORTS)
+
 
-__all__ = ["ProteinAnnotationManager", "AnnotationConfiguration", "AnnotationMerger"]
+__all__ = list(_EXPORTS)
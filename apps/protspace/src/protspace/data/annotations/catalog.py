@@ -0,0 +1,69 @@
+"""Annotation names offered by each source.
+
+A leaf module with no imports, so that annotation validation and source
+splitting do not pull in requests, tqdm, or the retrievers. Each retriever
+imports (and re-exports) its own list from here.
+"""
+
+# UniProt annotations - these are the current protspace annotations
+UNIPROT_ANNOTATIONS = [
+    "annotation_score",
+    "cc_subcellular_location",
+    "ec",
+    "fragment",
+    "gene_name",
+    "go_bp",
+    "go_cc",
+    "go_mf",
+    "keyword",
+    "length",
+    "organism_id",
+    "protein_name",
+    "protein_existence",
+    "protein_families",
+    "reviewed",
+    "sequence",
+    "uniprot_kb_id",
+    "xref_pdb",
+]
+
+# Taxonomy annotations
+TAXONOMY_ANNOTATIONS = [
+    "root",
+    "domain",
+    "kingdom",
+    "phylum",
+    "class",
+    "order",
+    "family",
+    "genus",
+    "species",
+]
+
+# InterPro annotations - supported databases
+# Keys are used for CLI naming and dataset creation
+# Values are used when accessing the JSON output from the InterPro API
+INTERPRO_MAPPING = {
+    "pfam": "pfam",
+    "superfamily": "superfamily",
+    "cath": "cath-gene3d",
+    "signal_peptide": "phobius",
+    "smart": "smart",
+    "cdd": "cdd",
+    "panther": "panther",
+    "prosite": "prosite patterns",
+    "prints": "prints",
+}
+
+# List of supported InterPro annotations for easy access
+# pfam_clan is a derived annotation (computed from pfam in the transformer)
+INTERPRO_ANNOTATIONS = list(INTERPRO_MAPPING.keys()) + ["pfam_clan"]
+
+TED_ANNOTATIONS = ["ted_domains"]
+
+BIOCENTRAL_ANNOTATIONS = [
+    "predicted_subcellular_location",
+    "predicted_membrane",
+    "predicted_signal_peptide",
+    "predicted_transmembrane",
+]
@@ -5,38 +5,50 @@ This module handles annotation selection, validation, and source splitting.
 """
 
 import logging
+from functools import lru_cache
+from itertools import chain
 
-from protspace.data.annotations.retrievers.biocentral_retriever import (
+from protspace.data.annotations.catalog import (
     BIOCENTRAL_ANNOTATIONS,
-)
-from protspace.data.annotations.retrievers.interpro_retriever import (
     INTERPRO_ANNOTATIONS,
-)
-from protspace.data.annotations.retrievers.taxonomy_retriever import (
     TAXONOMY_ANNOTATIONS,
-)
-from protspace.data.annotations.retrievers.ted_retriever import (
     TED_ANNOTATIONS,
-)
-from protspace.data.annotations.retrievers.uniprot_retriever import (
     UNIPROT_ANNOTATIONS,
 )
 
 logger = logging.getLogger(__name__)
 
-# Constants
+# Constants. Tuples, so shared module state cannot be mutated by a caller.
 ALL_ANNOTATIONS = (
-    UNIPROT_ANNOTATIONS
-    + TAXONOMY_ANNOTATIONS
-    + INTERPRO_ANNOTATIONS
-    + TED_ANNOTATIONS
-    + BIOCENTRAL_ANNOTATIONS
+    *UNIPROT_ANNOTATIONS,
+    *TAXONOMY_ANNOTATIONS,
+    *INTERPRO_ANNOTATIONS,
+    *TED_ANNOTATIONS,
+    *BIOCENTRAL_ANNOTATIONS,
 )
-ALWAYS_INCLUDED_ANNOTATIONS = ["gene_name", "protein_name", "uniprot_kb_id"]
-NEEDED_UNIPROT_ANNOTATIONS = ["accession", "organism_id"]
+ALWAYS_INCLUDED_ANNOTATIONS = ("gene_name", "protein_name", "uniprot_kb_id")
+
+# Membership sets per API source, built once at import. The lists above keep
+# their order for output; these answer "is X from source Y" in O(1).
+_SOURCE_SETS = {
+    "uniprot": frozenset(UNIPROT_ANNOTATIONS),
+    "taxonomy": frozenset(TAXONOMY_ANNOTATIONS),
+    "interpro": frozenset(INTERPRO_ANNOTATIONS),
+    "ted": frozenset(TED_ANNOTATIONS),
+    "biocentral": frozenset(BIOCENTRAL_ANNOTATIONS),
+}
+_ALL_SET = frozenset().union(*_SOURCE_SETS.values())
+# Sources are disjoint, so each annotation maps to exactly one of them
+_SOURCE_OF = {
+    annotation: source
+    for source, members in _SOURCE_SETS.items()
+    for annotation in members
+}
+NEEDED_UNIPROT_ANNOTATIONS = ("accession", "organism_id")
+_NEEDED_SET = frozenset(NEEDED_UNIPROT_ANNOTATIONS)
 
 # User-facing UniProt annotations (excludes internal: sequence, organism_id)
-_UNIPROT_USER_ANNOTATIONS = [
+_UNIPROT_USER_ANNOTATIONS = (
     "annotation_score",
     "cc_subcellular_location",
     "ec",
@@ -51,28 +63,34 @@ _UNIPROT_USER_ANNOTATIONS = [
     "reviewed",
     "xref_pdb",
     # gene_name, protein_name, uniprot_kb_id added via ALWAYS_INCLUDED
-]
+)
 
 ANNOTATION_GROUPS = {
-    "default": [
+    "default": (
         "ec",
         "keyword",
         "length",
         "protein_families",
         "reviewed",
-    ],
+    ),
     "uniprot": _UNIPROT_USER_ANNOTATIONS,
-    "interpro": INTERPRO_ANNOTATIONS,
-    "taxonomy": TAXONOMY_ANNOTATIONS,
-    "ted": TED_ANNOTATIONS,
-    "biocentral": BIOCENTRAL_ANNOTATIONS,
-    "all": _UNIPROT_USER_ANNOTATIONS
-    + TAXONOMY_ANNOTATIONS
-    + INTERPRO_ANNOTATIONS
-    + TED_ANNOTATIONS
-    + BIOCENTRAL_ANNOTATIONS,
+    "interpro": tuple(INTERPRO_ANNOTATIONS),
+    "taxonomy": tuple(TAXONOMY_ANNOTATIONS),
+    "ted": tuple(TED_ANNOTATIONS),
+    "biocentral": tuple(BIOCENTRAL_ANNOTATIONS),
+    "all": (
+        *_UNIPROT_USER_ANNOTATIONS,
+        *TAXONOMY_ANNOTATIONS,
+        *INTERPRO_ANNOTATIONS,
+        *TED_ANNOTATIONS,
+        *BIOCENTRAL_ANNOTATIONS,
+    ),
 }
 
+# Everything a user may pass to -a (groups and annotations), for suggestions
+_VALID_NAMES = (*ANNOTATION_GROUPS, *ALL_ANNOTATIONS)
+_GROUP_NAMES = ", ".join(sorted(ANNOTATION_GROUPS))
+
 
 def expand_annotation_groups(annotations: list[str]) -> list[str]:
     """Replace group names with their member annotations.
@@ -87,20 +105,27 @@ def expand_annotation_groups(annotations: list[str]) -> list[str]:
     Returns:
         List of individual annotation names with groups expanded and duplicates removed
     """
-    expanded = []
-    seen = set()
-    for name in annotations:
-        members = ANNOTATION_GROUPS.get(name, [name])
-        for member in members:
-            if member not in seen:
-                seen.add(member)
-                expanded.append(member)
-    return expanded
+    return list(
+        dict.fromkeys(
+            chain.from_iterable(
+                ANNOTATION_GROUPS.get(name, (name,)) for name in annotations
+            )
+        )
+    )
 
 
 class AnnotationConfiguration:
     """Manages annotation selection, validation, and source splitting."""
 
+    __slots__ = (
+        "user_annotations",
+        "uniprot_annotations",
+        "taxonomy_annotations",
+        "interpro_annotations",
+        "ted_annotations",
+        "biocentral_annotations",
+    )
+
     def __init__(self, user_annotations: list[str] = None):
         """
         Initialize annotation configuration.
@@ -108,14 +133,36 @@ class AnnotationConfiguration:
         Args:
             user_annotations: List of annotation names requested by user (None = use defaults)
         """
-        self.user_annotations = self._validate(user_annotations)
+        key = None if user_annotations is None else tuple(user_annotations)
+        user, *by_source = self._resolve(key)
+        # Fresh lists per instance: the cached tuples are shared across calls
+        self.user_annotations = list(user)
         (
             self.uniprot_annotations,
             self.taxonomy_annotations,
             self.interpro_annotations,
             self.ted_annotations,
             self.biocentral_annotations,
-        ) = self._split_by_source()
+        ) = (None if names is None else list(names) for names in by_source)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _resolve(
+        user_annotations: tuple[str, ...] | None,
+    ) -> tuple[tuple[str, ...] | None, ...]:
+        """Validate and split once per distinct (ordered) request.
+
+        The same selection is resolved several times per run (CLI validation,
+        annotation manager), so the result is memoised. The key keeps order
+        because it decides the output column order. Errors are not cached.
+        """
+        validated = AnnotationConfiguration._validate(
+            None if user_annotations is None else list(user_annotations)
+        )
+        return (
+            tuple(validated),
+            *AnnotationConfiguration._split_by_source(validated),
+        )
 
     @staticmethod
     def categorize_annotations_by_source(annotations: set[str]) -> dict[str, set[str]]:
@@ -129,11 +176,7 @@ class AnnotationConfiguration:
             Dictionary mapping source names to sets of annotations from that source
         """
         return {
-            "uniprot": annotations & set(UNIPROT_ANNOTATIONS),
-            "taxonomy": annotations & set(TAXONOMY_ANNOTATIONS),
-            "interpro": annotations & set(INTERPRO_ANNOTATIONS),
-            "ted": annotations & set(TED_ANNOTATIONS),
-            "biocentral": annotations & set(BIOCENTRAL_ANNOTATIONS),
+            source: annotations & members for source, members in _SOURCE_SETS.items()
         }
 
     @staticmethod
@@ -150,15 +193,27 @@ class AnnotationConfiguration:
         Returns:
             Dictionary mapping source names to boolean indicating if fetch is needed
         """
+        if required_annotations <= cached_annotations:
+            # Fully cached (the common case on re-runs): nothing to plan
+            return dict.fromkeys(_SOURCE_SETS, False)
+        # Fresh dict per call: the cached result is shared across calls
+        return dict(
+            AnnotationConfiguration._sources_to_fetch(
+                frozenset(cached_annotations), frozenset(required_annotations)
+            )
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _sources_to_fetch(
+        cached_annotations: frozenset[str], required_annotations: frozenset[str]
+    ) -> tuple[tuple[str, bool], ...]:
+        """Memoised core of :meth:`determine_sources_to_fetch`."""
         missing = required_annotations - cached_annotations
         categorized = AnnotationConfiguration.categorize_annotations_by_source(missing)
 
         sources_needed = {
-            "uniprot": len(categorized["uniprot"]) > 0,
-            "taxonomy": len(categorized["taxonomy"]) > 0,
-            "interpro": len(categorized["interpro"]) > 0,
-            "ted": len(categorized["ted"]) > 0,
-            "biocentral": len(categorized["biocentral"]) > 0,
+            source: bool(members) for source, members in categorized.items()
         }
 
         # Handle dependencies: taxonomy needs organism_id from UniProt
@@ -169,9 +224,10 @@ class AnnotationConfiguration:
         if sources_needed["interpro"] and "sequence" not in cached_annotations:
             sources_needed["uniprot"] = True
 
-        return sources_needed
+        return tuple(sources_needed.items())
 
-    def _validate(self, user_annotations: list[str] | None) -> list[str]:
+    @staticmethod
+    def _validate(user_annotations: list[str] | None) -> list[str]:
         """
         Validate requested annotations against available annotations.
 
@@ -182,80 +238,80 @@ class AnnotationConfiguration:
             Validated list of annotations
 
         Raises:
-            ValueError: If any requested annotation is not available
+            ValueError: If any requested annotation is not available (all
+                unknown names are reported at once)
         """
         if user_annotations is None:
             user_annotations = ["default"]
 
         user_annotations = expand_annotation_groups(user_annotations)
 
-        all_annotations = ALL_ANNOTATIONS
-        normalized_annotations = []
-
-        for annotation in user_annotations + ALWAYS_INCLUDED_ANNOTATIONS:
-            if annotation not in all_annotations:
-                from difflib import get_close_matches
-
-                candidates = list(ANNOTATION_GROUPS.keys()) + all_annotations
-                suggestions = get_close_matches(annotation, candidates, n=3, cutoff=0.5)
-                hint = (
-                    f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
-                )
-                groups = ", ".join(sorted(ANNOTATION_GROUPS.keys()))
-                raise ValueError(
-                    f"Unknown annotation '{annotation}'.{hint}\n"
-                    f"  Groups: {groups}\n"
-                    f"  See https://github.com/tsenoner/protspace/blob/main/apps/protspace/docs/annotations.md"
+        requested = list(
+            dict.fromkeys(chain(user_annotations, ALWAYS_INCLUDED_ANNOTATIONS))
+        )
+        unknown = [a for a in requested if a not in _ALL_SET]
+        if unknown:
+            from difflib import get_close_matches
+
+            suggestions = list(
+                dict.fromkeys(
+                    chain.from_iterable(
+                        get_close_matches(a, _VALID_NAMES, n=3, cutoff=0.5)
+                        for a in unknown
+                    )
                 )
-            if annotation not in normalized_annotations:
-                normalized_annotations.append(annotation)
+            )
+            hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+            names = ", ".join(f"'{a}'" for a in unknown)
+            raise ValueError(
+                f"Unknown annotation{'s' if len(unknown) > 1 else ''} {names}.{hint}\n"
+                f"  Groups: {_GROUP_NAMES}\n"
+                f"  See https://github.com/tsenoner/protspace/blob/main/apps/protspace/docs/annotations.md"
+            )
 
-        return normalized_annotations
+        return requested
 
+    @staticmethod
     def _split_by_source(
-        self,
+        user_annotations: list[str],
     ) -> tuple[
-        list[str],
-        list[str] | None,
-        list[str] | None,
-        list[str] | None,
-        list[str] | None,
+        tuple[str, ...],
+        tuple[str, ...] | None,
+        tuple[str, ...] | None,
+        tuple[str, ...] | None,
+        tuple[str, ...] | None,
     ]:
-        """Split annotations into source-specific lists.
+        """Split annotations into source-specific tuples.
 
         Returns:
             Tuple of (uniprot, taxonomy, interpro, ted, biocentral) annotations
         """
-        uniprot_annotations = [
-            a for a in self.user_annotations if a in UNIPROT_ANNOTATIONS
-        ]
-        taxonomy_annotations = [
-            a for a in self.user_annotations if a in TAXONOMY_ANNOTATIONS
-        ]
-        interpro_annotations = [
-            a for a in self.user_annotations if a in INTERPRO_ANNOTATIONS
-        ]
-        ted_annotations = [a for a in self.user_annotations if a in TED_ANNOTATIONS]
-        biocentral_annotations = [
-            a for a in self.user_annotations if a in BIOCENTRAL_ANNOTATIONS
-        ]
+        buckets = {source: [] for source in _SOURCE_SETS}
+        for a in user_annotations:
+            buckets[_SOURCE_OF[a]].append(a)
+        uniprot_annotations = buckets["uniprot"]
+        taxonomy_annotations = buckets["taxonomy"]
+        interpro_annotations = buckets["interpro"]
+        ted_annotations = buckets["ted"]
+        biocentral_annotations = buckets["biocentral"]
 
         # Add required annotations (accession, organism_id) and sequence if needed
         needs_sequence = bool(interpro_annotations or biocentral_annotations)
-        uniprot_annotations = self._add_required_annotations(
+        uniprot_annotations = AnnotationConfiguration._add_required_annotations(
             uniprot_annotations, needs_sequence=needs_sequence
         )
 
         return (
-            uniprot_annotations,
-            taxonomy_annotations or None,
-            interpro_annotations or None,
-            ted_annotations or None,
-            biocentral_annotations or None,
+            tuple(uniprot_annotations),
+            tuple(taxonomy_annotations) or None,
+            tuple(interpro_annotations) or None,
+            tuple(ted_annotations) or None,
+            tuple(biocentral_annotations) or None,
         )
 
+    @staticmethod
     def _add_required_annotations(
-        self, annotations: list[str], *, needs_sequence: bool = False
+        annotations: list[str], *, needs_sequence: bool = False
     ) -> list[str]:
         """Add required annotations (accession, organism_id) and optionally sequence.
 
@@ -266,10 +322,8 @@ class AnnotationConfiguration:
         Returns:
             Updated list with required annotations
         """
-        filtered_annotations = [
-            f for f in annotations if f not in NEEDED_UNIPROT_ANNOTATIONS
-        ]
-        result = NEEDED_UNIPROT_ANNOTATIONS + filtered_annotations
+        filtered_annotations = [f for f in annotations if f not in _NEEDED_SET]
+        result = [*NEEDED_UNIPROT_ANNOTATIONS, *filtered_annotations]
 
         if needs_sequence and "sequence" not in result:
             result.append("sequence")
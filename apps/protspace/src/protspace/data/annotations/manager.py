@@ -5,6 +5,7 @@ This module provides the main orchestrator for annotation extraction workflow.
 """
 
 import logging
+from collections import Counter
 from pathlib import Path
 
 import pandas as pd
@@ -85,7 +86,8 @@ class ProteinAnnotationManager:
 
         # Initialize components
         self.transformer = AnnotationTransformer()
-        self.merger = AnnotationMerger()
+        # Fetched and cache-rebuilt records are owned here and not reused
+        self.merger = AnnotationMerger(copy=False)
         self.writer = AnnotationWriter(transformer=self.transformer)
 
     def to_pd(self) -> pd.DataFrame:
@@ -322,14 +324,15 @@ class ProteinAnnotationManager:
     @staticmethod
     def _get_taxon_counts(fetched_uniprot: list[ProteinAnnotations]) -> dict:
         """Returns a dictionary with organism IDs as keys and their occurrence counts as values."""
+        # Count raw ids first so int() runs once per organism, not per protein
+        raw_counts = Counter(p.annotations.get("organism_id") for p in fetched_uniprot)
         id_counts = {}
 
-        for protein in fetched_uniprot:
-            organism_id = protein.annotations.get("organism_id")
+        for organism_id, count in raw_counts.items():
             if organism_id:
                 try:
                     org_id = int(organism_id)
-                    id_counts[org_id] = id_counts.get(org_id, 0) + 1
+                    id_counts[org_id] = id_counts.get(org_id, 0) + count
                 except ValueError:
                     pass
 
@@ -4,14 +4,25 @@ Annotation merging logic.
 This module handles merging annotations from multiple sources (UniProt, Taxonomy, InterPro).
 """
 
-from collections import namedtuple
-
-ProteinAnnotations = namedtuple("ProteinAnnotations", ["identifier", "annotations"])
+from protspace.data.annotations.types import ProteinAnnotations
 
 
 class AnnotationMerger:
     """Merges annotations from multiple sources."""
 
+    __slots__ = ("copy",)
+
+    def __init__(self, copy: bool = True):
+        """
+        Initialize merger.
+
+        Args:
+            copy: Copy each UniProt annotations dict before merging into it.
+                Pass False when the caller owns the input and discards it
+                after merging; the dicts are then updated in place.
+        """
+        self.copy = copy
+
     def merge(
         self,
         uniprot_annotations: list[ProteinAnnotations],
@@ -20,135 +31,74 @@ class AnnotationMerger:
         ted_annotations: list[ProteinAnnotations] = None,
         biocentral_annotations: list[ProteinAnnotations] = None,
     ) -> list[ProteinAnnotations]:
-        """Merge annotations from all sources."""
-        interpro_dict = self._create_lookup_dict(interpro_annotations)
-        ted_dict = self._create_lookup_dict(ted_annotations)
-        biocentral_dict = self._create_lookup_dict(biocentral_annotations)
-
-        merged_annotations = []
-        for protein in uniprot_annotations:
-            merged_protein = self._merge_protein(
-                protein,
-                taxonomy_annotations,
-                interpro_dict,
-                ted_dict,
-                biocentral_dict,
-            )
-            merged_annotations.append(merged_protein)
-
-        return merged_annotations
-
-    @staticmethod
-    def _create_lookup_dict(
-        annotations: list[ProteinAnnotations] | None,
-    ) -> dict:
-        """Create a dictionary mapping protein identifier to annotations."""
-        if not annotations:
-            return {}
-        return {p.identifier: p.annotations for p in annotations}
+        """Merge annotations from all sources.
 
-    def _merge_protein(
-        self,
-        protein: ProteinAnnotations,
-        taxonomy_annotations: dict,
-        interpro_dict: dict,
-        ted_dict: dict = None,
-        biocentral_dict: dict = None,
-    ) -> ProteinAnnotations:
+        Later sources win on key collisions: UniProt, then taxonomy, InterPro,
+        TED, and Biocentral.
         """
-        Merge all annotation sources for a single protein.
-
-        Args:
-            protein: ProteinAnnotations from UniProt
-            taxonomy_annotations: Dict of taxonomy annotations
-            interpro_dict: Dict of InterPro annotations
-
-        Returns:
-            ProteinAnnotations with merged annotations
-        """
-        # Create a copy to avoid modifying the original
-        updated_annotations = protein.annotations.copy()
-
-        # Merge taxonomy annotations
-        updated_annotations = self._merge_taxonomy(
-            updated_annotations,
-            protein.annotations.get("organism_id"),
-            taxonomy_annotations,
-        )
-
-        # Merge InterPro annotations
-        updated_annotations = self._merge_interpro(
-            updated_annotations, protein.identifier, interpro_dict
+        taxonomy_by_organism = _taxonomy_by_organism(
+            uniprot_annotations, taxonomy_annotations
         )
-
-        # Merge TED annotations
-        if ted_dict:
-            updated_annotations = self._merge_interpro(
-                updated_annotations, protein.identifier, ted_dict
+        interpro_dict = _lookup_by_identifier(interpro_annotations)
+        ted_dict = _lookup_by_identifier(ted_annotations)
+        biocentral_dict = _lookup_by_identifier(biocentral_annotations)
+        empty = {}
+
+        if self.copy:
+            # One fused dict build per protein instead of copy() + updates
+            return [
+                ProteinAnnotations(
+                    identifier=p.identifier,
+                    annotations={
+                        **p.annotations,
+                        **taxonomy_by_organism.get(
+                            p.annotations.get("organism_id"), empty
+                        ),
+                        **interpro_dict.get(p.identifier, empty),
+                        **ted_dict.get(p.identifier, empty),
+                        **biocentral_dict.get(p.identifier, empty),
+                    },
+                )
+                for p in uniprot_annotations
+            ]
+
+        for p in uniprot_annotations:
+            annotations = p.annotations
+            annotations.update(
+                taxonomy_by_organism.get(annotations.get("organism_id"), empty)
             )
-
-        # Merge Biocentral predictions
-        if biocentral_dict:
-            updated_annotations = self._merge_interpro(
-                updated_annotations, protein.identifier, biocentral_dict
-            )
-
-        return ProteinAnnotations(
-            identifier=protein.identifier, annotations=updated_annotations
-        )
-
-    @staticmethod
-    def _merge_taxonomy(
-        annotations: dict, organism_id: str, taxonomy_annotations: dict
-    ) -> dict:
-        """
-        Merge taxonomy annotations for a protein.
-
-        Args:
-            annotations: Existing protein annotations
-            organism_id: Organism ID from UniProt
-            taxonomy_annotations: Dict of taxonomy annotations
-
-        Returns:
-            Updated annotations dict
-        """
-        if not organism_id or not taxonomy_annotations:
-            return annotations
-
+            annotations.update(interpro_dict.get(p.identifier, empty))
+            annotations.update(ted_dict.get(p.identifier, empty))
+            annotations.update(biocentral_dict.get(p.identifier, empty))
+        return list(uniprot_annotations)
+
+
+def _lookup_by_identifier(
+    annotations: list[ProteinAnnotations] | None,
+) -> dict:
+    """Create a dictionary mapping protein identifier to annotations."""
+    return {p.identifier: p.annotations for p in annotations or ()}
+
+
+def _taxonomy_by_organism(
+    proteins: list[ProteinAnnotations], taxonomy_annotations: dict | None
+) -> dict:
+    """Map each distinct raw organism_id to its taxonomy annotations.
+
+    ``int(organism_id)`` is resolved once per organism instead of once per
+    protein. Empty, non-numeric, or unknown organism ids are left out.
+    """
+    if not taxonomy_annotations or not proteins:
+        return {}
+    lookup = {}
+    for organism_id in {p.annotations.get("organism_id") for p in proteins}:
+        if not organism_id:
+            continue
         try:
-            organism_id_int = int(organism_id)
-            if organism_id_int in taxonomy_annotations:
-                tax_annotations = taxonomy_annotations[organism_id_int]["annotations"]
-
-                # Add each taxonomy annotation
-                for annotation_name, annotation_value in tax_annotations.items():
-                    annotations[annotation_name] = annotation_value
-        except (ValueError, KeyError):
-            # Invalid organism_id or missing taxonomy data
-            pass
-
-        return annotations
-
-    @staticmethod
-    def _merge_interpro(
-        annotations: dict, identifier: str, interpro_dict: dict
-    ) -> dict:
-        """
-        Merge InterPro annotations for a protein.
-
-        Args:
-            annotations: Existing protein annotations
-            identifier: Protein identifier
-            interpro_dict: Dict of InterPro annotations
-
-        Returns:
-            Updated annotations dict
-        """
-        if identifier in interpro_dict:
-            interpro_data = interpro_dict[identifier]
-
-            # Add each InterPro annotation
-            for annotation_name, annotation_value in interpro_data.items():
-                annotations[annotation_name] = annotation_value
-
-        return annotations
+            entry = taxonomy_annotations.get(int(organism_id))
+        except (ValueError, TypeError):
+            # Invalid organism_id
+            continue
+        if entry is not None:
+            lookup[organism_id] = entry["annotations"]
+    return lookup
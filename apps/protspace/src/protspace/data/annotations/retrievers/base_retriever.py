@@ -5,9 +5,8 @@ This module provides an abstract base class for all annotation retrievers.
 """
 
 from abc import ABC, abstractmethod
-from collections import namedtuple
 
-ProteinAnnotations = namedtuple("ProteinAnnotations", ["identifier", "annotations"])
+from protspace.data.annotations.types import ProteinAnnotations
 
 
 class BaseAnnotationRetriever(ABC):
@@ -4,17 +4,12 @@ import logging
 import re
 import warnings
 
+from protspace.data.annotations.catalog import BIOCENTRAL_ANNOTATIONS
 from protspace.data.annotations.retrievers.base_retriever import BaseAnnotationRetriever
+from protspace.data.annotations.types import ProteinAnnotations
 
 logger = logging.getLogger(__name__)
 
-BIOCENTRAL_ANNOTATIONS = [
-    "predicted_subcellular_location",
-    "predicted_membrane",
-    "predicted_signal_peptide",
-    "predicted_transmembrane",
-]
-
 # Biocentral prediction models used for each annotation
 _PREDICTION_MODELS = {
     "predicted_subcellular_location": "LIGHTATTENTIONSUBCELLULARLOCALIZATION",
@@ -40,12 +35,8 @@ class BiocentralPredictionRetriever(BaseAnnotationRetriever):
         self.annotations = annotations or BIOCENTRAL_ANNOTATIONS
         self.sequences = sequences or {}
 
-    def fetch_annotations(self) -> list[tuple]:
+    def fetch_annotations(self) -> list[ProteinAnnotations]:
         """Fetch prediction annotations for all proteins."""
-        from protspace.data.annotations.retrievers.uniprot_retriever import (
-            ProteinAnnotations,
-        )
-
         if not self.sequences or not any(self.sequences.values()):
             logger.debug("No sequences available for Biocentral predictions")
             return [
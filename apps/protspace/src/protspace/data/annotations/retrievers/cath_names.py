@@ -12,6 +12,8 @@ from pathlib import Path
 
 import requests
 
+from protspace.utils.atomic import atomic_write_bytes
+
 logger = logging.getLogger(__name__)
 
 CATH_NAMES_URL = (
@@ -55,8 +57,11 @@ def get_cath_names() -> dict[str, str]:
 
         names = _parse_cath_names(raw_path)
 
-        cache_file.write_text(json.dumps(names))
-        timestamp_file.write_text(str(time.time()))
+        # Data first, timestamp only once the data is in place: a crash in
+        # between leaves a fresh map with an old (or no) timestamp, which
+        # just re-downloads, never an old map marked fresh. Keep this order.
+        atomic_write_bytes(cache_file, json.dumps(names).encode())
+        atomic_write_bytes(timestamp_file, str(time.time()).encode())
         logger.info(f"Cached {len(names)} CATH names")
         return names
 
@@ -3,10 +3,39 @@
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 API_TIMEOUT = 30
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def retrying_session(
+    pool_size: int = 10, retries: int = 3, backoff_factor: float = 0.5
+) -> requests.Session:
+    """Return a Session that reuses connections and retries transient errors.
+
+    Connection failures and ``RETRY_STATUS_CODES`` are retried with
+    exponential backoff, including for POST (the lookup APIs we POST to
+    are idempotent). After the last retry the final response is returned
+    rather than raised, so callers keep their own status handling.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=None,  # retry every method
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def paginated_get(
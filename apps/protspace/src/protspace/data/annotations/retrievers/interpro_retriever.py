@@ -1,50 +1,41 @@
 import gzip
 import hashlib
+import io
 import json
 import logging
-import os
-import tempfile
 import time
 import xml.etree.ElementTree as ET
-from collections import namedtuple
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import NamedTuple
 
 import requests
 from tqdm import tqdm
 
+from protspace.data.annotations.catalog import INTERPRO_ANNOTATIONS, INTERPRO_MAPPING
 from protspace.data.annotations.encoding import encode_field
 from protspace.data.annotations.retrievers.base_retriever import BaseAnnotationRetriever
 from protspace.data.annotations.retrievers.cath_names import get_cath_names
+from protspace.data.annotations.retrievers.http_utils import retrying_session
+from protspace.data.annotations.types import ProteinAnnotations
+from protspace.utils.atomic import atomic_write_bytes
 
 logger = logging.getLogger(__name__)
 
-# InterPro annotations - supported databases
-# Keys are used for CLI naming and dataset creation
-# Values are used when accessing the JSON output from the InterPro API
-INTERPRO_MAPPING = {
-    "pfam": "pfam",
-    "superfamily": "superfamily",
-    "cath": "cath-gene3d",
-    "signal_peptide": "phobius",
-    "smart": "smart",
-    "cdd": "cdd",
-    "panther": "panther",
-    "prosite": "prosite patterns",
-    "prints": "prints",
-}
-
-# List of supported InterPro annotations for easy access
-# pfam_clan is a derived annotation (computed from pfam in the transformer)
-INTERPRO_ANNOTATIONS = list(INTERPRO_MAPPING.keys()) + ["pfam_clan"]
-
 # Annotations derived from other InterPro fields (not fetched from API directly)
 DERIVED_INTERPRO_ANNOTATIONS = {"pfam_clan"}
 
+# Reverse mapping from API database names to our keys
+_API_TO_KEY = {v: k for k, v in INTERPRO_MAPPING.items()}
+_SUPPORTED_ANNOTATIONS = frozenset(INTERPRO_ANNOTATIONS)
+
 # API Configuration
 BASE_URL = "https://www.ebi.ac.uk/interpro/matches/api"
 INTERPRO_ENTRY_URL = "https://www.ebi.ac.uk/interpro/api/entry"
 CHUNK_SIZE = 100  # As per API documentation for batch requests
+MAX_CONCURRENT_BATCHES = 4  # Batches in flight at once (keep the shared API happy)
 
 # Mapping from annotation key to InterPro entry API database path
 # Used to resolve human-readable names for databases where the matches API
@@ -61,6 +52,7 @@ INTERPRO_XML_URL = (
 )
 INTERPRO_CACHE_DIR = Path.home() / ".cache" / "protspace" / "interpro"
 CACHE_MAX_AGE_DAYS = 7
+_GZIP_READ_BUFFER = 1 << 20  # 1 MiB
 
 # Mapping from annotation key to the db attribute used in the XML <db_xref> elements
 _ANNOTATION_KEY_TO_XML_DB = {
@@ -70,9 +62,32 @@ _ANNOTATION_KEY_TO_XML_DB = {
 }
 
 # The set of db attribute values we extract from the XML
-_XML_DBS_OF_INTEREST = set(_ANNOTATION_KEY_TO_XML_DB.values())
+_XML_DBS_OF_INTEREST = frozenset(_ANNOTATION_KEY_TO_XML_DB.values())
 
-ProteinAnnotations = namedtuple("ProteinAnnotations", ["identifier", "annotations"])
+
+def _format_accessions(by_accession: dict[str, list]) -> str:
+    """Format ``{accession: [scores, name]}`` as one annotation value.
+
+    Entries are sorted by accession and joined with ``;``, each as
+    ``accession (name)|score1,score2``. The name part is omitted when empty,
+    as is the score part when there are no scores. The pieces are joined
+    once, rather than building an f-string per accession and per entry.
+    """
+    parts = []
+    append = parts.append
+    for accession in sorted(by_accession):
+        scores, name = by_accession[accession]
+        if parts:
+            append(";")
+        append(accession)
+        if name:
+            append(" (")
+            append(encode_field(name))
+            append(")")
+        if scores:
+            append("|")
+            append(",".join(scores))
+    return "".join(parts)
 
 
 class InterProRetriever(BaseAnnotationRetriever):
@@ -116,6 +131,9 @@ class InterProRetriever(BaseAnnotationRetriever):
             sequences: Dictionary mapping protein identifiers to their sequences (needed for MD5 calculation)
         """
         super().__init__(headers, annotations)
+        # One pooled session for all batches: connections stay alive and
+        # transient API errors are retried
+        self._session = retrying_session(pool_size=MAX_CONCURRENT_BATCHES)
         self.headers = self._manage_headers(self.headers) if self.headers else []
         self.annotations = (
             self.annotations if self.annotations else INTERPRO_ANNOTATIONS
@@ -124,26 +142,26 @@ class InterProRetriever(BaseAnnotationRetriever):
 
         # Validate annotations
         invalid_annotations = [
-            f for f in self.annotations if f not in INTERPRO_ANNOTATIONS
+            f for f in self.annotations if f not in _SUPPORTED_ANNOTATIONS
         ]
         if invalid_annotations:
             logger.warning(
                 f"Invalid InterPro annotations: {invalid_annotations}. Supported: {INTERPRO_ANNOTATIONS}"
             )
             self.annotations = [
-                f for f in self.annotations if f in INTERPRO_ANNOTATIONS
+                f for f in self.annotations if f in _SUPPORTED_ANNOTATIONS
             ]
 
         # Ensure dependencies: pfam_clan requires pfam
         if "pfam_clan" in self.annotations and "pfam" not in self.annotations:
             self.annotations.append("pfam")
 
-    def fetch_annotations(self) -> list[NamedTuple]:
+    def fetch_annotations(self) -> list[ProteinAnnotations]:
         """
         Fetch InterPro annotations for all proteins.
 
         Returns:
-            List of ProteinAnnotations namedtuples containing identifier and annotations
+            List of ProteinAnnotations containing identifier and annotations
         """
         if not self.headers:
             logger.warning("No headers provided for InterPro annotation retrieval")
@@ -155,17 +173,31 @@ class InterProRetriever(BaseAnnotationRetriever):
             )
             return []
 
-        # Calculate MD5 hashes for sequences
+        # Calculate MD5 hashes, once per distinct sequence. Identifiers
+        # sharing a sequence are queried once and get copies of its result.
         md5_to_identifier = {}
+        md5_by_sequence = {}
+        duplicates = defaultdict(list)  # first identifier -> the others
         missing_sequences = []
 
-        for header in self.headers:
-            if header in self.sequences:
-                sequence = self.sequences[header]
-                md5_hash = hashlib.md5(sequence.encode("utf-8")).hexdigest().upper()
-                md5_to_identifier[md5_hash] = header
-            else:
+        # Sequential on purpose: protein-length inputs hash in about a
+        # microsecond, far below what a thread pool costs to dispatch.
+        for header in dict.fromkeys(self.headers):
+            sequence = self.sequences.get(header)
+            if sequence is None:
                 missing_sequences.append(header)
+                continue
+            md5_hash = md5_by_sequence.get(sequence)
+            if md5_hash is not None:
+                duplicates[md5_to_identifier[md5_hash]].append(header)
+                continue
+            md5_hash = (
+                hashlib.md5(sequence.encode("utf-8"), usedforsecurity=False)
+                .hexdigest()
+                .upper()
+            )
+            md5_by_sequence[sequence] = md5_hash
+            md5_to_identifier[md5_hash] = header
 
         if missing_sequences:
             logger.debug(
@@ -179,71 +211,111 @@ class InterProRetriever(BaseAnnotationRetriever):
 
         # Fetch InterPro matches
         md5s = list(md5_to_identifier.keys())
-        api_results = self._get_matches_in_batches(md5s)
+        api_results = iter(self._get_matches_in_batches(md5s))
 
-        if not api_results:
+        first = next(api_results, None)
+        if first is None:
             logger.warning("No results returned from InterPro API")
             return []
 
-        # Parse results and create annotations
-        return self._parse_interpro_results(api_results, md5_to_identifier)
+        # Parse results as they stream in and create annotations
+        parsed = self._parse_interpro_results(
+            chain((first,), api_results), md5_to_identifier
+        )
+        if not duplicates:
+            return parsed
 
-    def _get_matches_in_batches(self, md5s: list[str]) -> list[dict]:
+        result = []
+        for protein in parsed:
+            result.append(protein)
+            result.extend(
+                ProteinAnnotations(
+                    identifier=other, annotations=dict(protein.annotations)
+                )
+                for other in duplicates.get(protein.identifier, ())
+            )
+        return result
+
+    def _get_matches_in_batches(self, md5s: list[str]) -> Iterator[dict]:
         """
         Submit MD5 hashes to InterPro API in batches.
 
+        Batches are independent, so up to ``MAX_CONCURRENT_BATCHES`` are in
+        flight at once. Results are yielded in batch order as soon as each
+        batch is in, so only a window of raw batch responses is held in
+        memory rather than the whole run's.
+
         Args:
             md5s: List of MD5 hashes to query
 
-        Returns:
-            List of API result dictionaries
+        Yields:
+            API result dictionaries
         """
-        all_results = []
         chunks = [md5s[i : i + CHUNK_SIZE] for i in range(0, len(md5s), CHUNK_SIZE)]
 
         logger.info(
             f"Submitting {len(md5s)} sequences to InterPro API in {len(chunks)} batch(es)..."
         )
 
-        with tqdm(
-            total=len(md5s), desc="Fetching InterPro annotations", unit="seq"
-        ) as pbar:
-            for i, chunk in enumerate(chunks, 1):
-                post_url = f"{BASE_URL}/matches"
-                payload = {"md5": chunk}
-
-                try:
-                    response = requests.post(
-                        post_url,
-                        json=payload,
-                        headers={"Accept": "application/json"},
-                        timeout=30,
-                    )
-
-                    if response.status_code == 200:
-                        batch_results = response.json().get("results", [])
-                        all_results.extend(batch_results)
-                    else:
-                        logger.error(
-                            f"Error processing batch {i}: {response.status_code} - {response.text}"
-                        )
+        total = 0
+        pending = deque()  # (chunk, future) in batch order
+        with (
+            tqdm(
+                total=len(md5s), desc="Fetching InterPro annotations", unit="seq"
+            ) as pbar,
+            ThreadPoolExecutor(
+                max_workers=min(MAX_CONCURRENT_BATCHES, len(chunks)) or 1
+            ) as pool,
+        ):
+
+            def oldest_results() -> list[dict]:
+                nonlocal total
+                chunk, future = pending.popleft()
+                batch_results = future.result()
+                pbar.update(len(chunk))
+                total += len(batch_results)
+                return batch_results
 
-                except requests.exceptions.RequestException as e:
-                    logger.error(f"Request error for batch {i}: {e}")
+            for i, chunk in enumerate(chunks, 1):
+                pending.append((chunk, pool.submit(self._post_batch, i, chunk)))
+                # Window full: hand out the oldest batch before submitting more
+                if len(pending) == MAX_CONCURRENT_BATCHES:
+                    yield from oldest_results()
+            while pending:
+                yield from oldest_results()
 
-                pbar.update(len(chunk))
+        logger.info(f"Retrieved {total} total results from InterPro API")
 
-        logger.info(f"Retrieved {len(all_results)} total results from InterPro API")
-        return all_results
+    def _post_batch(self, i: int, chunk: list[str]) -> list[dict]:
+        """POST one batch of MD5s; errors are logged and yield no results."""
+        try:
+            response = self._session.post(
+                f"{BASE_URL}/matches",
+                json={"md5": chunk},
+                headers={"Accept": "application/json"},
+                timeout=30,
+            )
+            if response.status_code != 200:
+                logger.error(
+                    f"Error processing batch {i}: {response.status_code} - {response.text}"
+                )
+                return []
+            return response.json().get("results", [])
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError: a 200 with a malformed body must not abort the
+            # other batches
+            logger.error(f"Request error for batch {i}: {e}")
+            return []
 
     def _parse_interpro_results(
-        self, api_results: list[dict], md5_to_identifier: dict[str, str]
-    ) -> list[NamedTuple]:
+        self, api_results: Iterable[dict], md5_to_identifier: dict[str, str]
+    ) -> list[ProteinAnnotations]:
         """
         Parse InterPro API results and extract relevant annotations with confidence scores.
 
         Args:
-            api_results: Raw API results from InterPro
+            api_results: Raw API results from InterPro (consumed once, so a
+                streaming iterator works)
             md5_to_identifier: Mapping from MD5 hash to protein identifier
 
         Returns:
@@ -254,17 +326,10 @@ class InterProRetriever(BaseAnnotationRetriever):
             All scores for each accession are collected and stored together.
             Names (if available) are included in parentheses after the accession.
         """
-        # Create reverse mapping from API database names to our keys
-        api_to_key = {v: k for k, v in INTERPRO_MAPPING.items()}
-
-        # Initialize annotation dictionary for each protein
-        # Store accessions, names, and scores separately to maintain correspondence
-        protein_annotations = {}
-        for identifier in md5_to_identifier.values():
-            protein_annotations[identifier] = {
-                annotation: {"accessions": [], "names": [], "scores": []}
-                for annotation in self.annotations
-            }
+        # Collect matches as flat columns per annotation (struct of arrays):
+        # one row per match, and no per-protein containers for proteins or
+        # databases without hits
+        columns = {annotation: ([], [], [], []) for annotation in self.annotations}
 
         # Parse API results
         for result in api_results:
@@ -275,105 +340,80 @@ class InterProRetriever(BaseAnnotationRetriever):
             protein_id = md5_to_identifier[sequence_md5]
 
             for match in result.get("matches", []):
-                signature = match.get("signature", {})
-                sig_lib = signature.get("signatureLibraryRelease", {})
-                source_db = sig_lib.get("library", "").lower()
+                signature = match.get("signature")
+                sig_lib = signature and signature.get("signatureLibraryRelease")
+                if not sig_lib:
+                    continue
 
                 # Map API database name to our key and check if we're interested in it
-                if source_db in api_to_key:
-                    annotation_key = api_to_key[source_db]
-                    if annotation_key in self.annotations:
-                        signature_accession = signature.get("accession", "")
-                        if signature_accession:
-                            # Extract name and confidence score from match
-                            signature_name = signature.get("name", "")
-                            score = match.get("score")
-
-                            protein_annotations[protein_id][annotation_key][
-                                "accessions"
-                            ].append(signature_accession)
-                            # Store name, using empty string if not available
-                            protein_annotations[protein_id][annotation_key][
-                                "names"
-                            ].append(signature_name)
-                            # Store score, using empty string if not available
-                            protein_annotations[protein_id][annotation_key][
-                                "scores"
-                            ].append(str(score) if score is not None else "")
+                annotation_key = _API_TO_KEY.get(sig_lib.get("library", "").lower())
+                if annotation_key not in columns:
+                    continue
+                signature_accession = signature.get("accession", "")
+                if signature_accession:
+                    # Extract name and confidence score from match
+                    score = match.get("score")
+                    proteins, accessions, names, scores = columns[annotation_key]
+                    proteins.append(protein_id)
+                    accessions.append(signature_accession)
+                    # Store name, using empty string if not available
+                    names.append(signature.get("name", ""))
+                    # Store score, using empty string if not available
+                    scores.append(str(score) if score is not None else "")
 
         # Resolve names via InterPro entry API for databases that don't
         # provide meaningful names in the matches API response
         resolved_names = {}
         for annotation_key in self.annotations:
             if annotation_key in ENTRY_API_DB_MAPPING:
-                all_accessions = set()
-                for annotations_data in protein_annotations.values():
-                    if annotation_key in annotations_data:
-                        all_accessions.update(
-                            annotations_data[annotation_key]["accessions"]
-                        )
                 resolved_names[annotation_key] = self._resolve_entry_names(
-                    all_accessions, annotation_key
+                    set(columns[annotation_key][1]), annotation_key
                 )
 
+        # Bucket row indices per protein once, keeping match order
+        rows_by_annotation = {}
+        for annotation_name, (proteins, *_) in columns.items():
+            rows_by_protein = defaultdict(list)
+            for row, protein_id in enumerate(proteins):
+                rows_by_protein[protein_id].append(row)
+            rows_by_annotation[annotation_name] = rows_by_protein
+
         # Convert to ProteinAnnotations objects
         result = []
-        for identifier, annotations_dict in protein_annotations.items():
+        for identifier in dict.fromkeys(md5_to_identifier.values()):
             # Convert to pipe-separated format: accession|score1,score2;accession2|score1
             processed_annotations = {}
-            for annotation_name, annotation_data in annotations_dict.items():
-                accessions = annotation_data["accessions"]
-                names = annotation_data["names"]
-                scores = annotation_data["scores"]
+            for annotation_name, (_, accessions, names, scores) in columns.items():
+                rows = rows_by_annotation[annotation_name].get(identifier)
 
-                if accessions:
+                if rows:
                     # Group all scores by accession (collect all occurrences)
-                    # Also track the name for each accession (use first non-empty name if multiple)
-                    accession_to_scores = {}
-                    accession_to_name = {}
-                    for acc, name, sc in zip(accessions, names, scores, strict=True):
-                        if acc not in accession_to_scores:
-                            accession_to_scores[acc] = []
-                            accession_to_name[acc] = name
+                    # in one pass: {accession: [scores, name]}, where the
+                    # name is the first non-empty one seen
+                    by_accession = {}
+                    for row in rows:
+                        acc, name, sc = accessions[row], names[row], scores[row]
+                        slot = by_accession.get(acc)
+                        if slot is None:
+                            slot = by_accession[acc] = [[], name]
+                        elif not slot[1]:
+                            slot[1] = name
                         # Only add non-empty scores
                         if sc:
-                            accession_to_scores[acc].append(sc)
-                        # Update name if current one is empty but we have a name
-                        if not accession_to_name[acc] and name:
-                            accession_to_name[acc] = name
+                            slot[0].append(sc)
 
                     # Inject names resolved from InterPro entry API
-                    if annotation_name in resolved_names:
-                        name_map = resolved_names[annotation_name]
-                        for acc in accession_to_name:
-                            if not accession_to_name[acc] and acc in name_map:
-                                accession_to_name[acc] = name_map[acc]
-
-                    # Sort by accession for consistency
-                    sorted_accessions = sorted(accession_to_scores.keys())
+                    name_map = resolved_names.get(annotation_name)
+                    if name_map:
+                        for acc, slot in by_accession.items():
+                            if not slot[1]:
+                                slot[1] = name_map.get(acc, "")
 
                     # Format as: accession(name)|score1,score2,score3;accession2|score1
-                    formatted_parts = []
-                    for acc in sorted_accessions:
-                        score_list = accession_to_scores[acc]
-                        name = accession_to_name[acc]
-
-                        # Format accession with name if available
-                        if name:
-                            acc_with_name = f"{acc} ({encode_field(name)})"
-                        else:
-                            acc_with_name = acc
-
-                        if score_list:
-                            # Format: accession(name)|score1,score2,score3
-                            formatted_parts.append(
-                                f"{acc_with_name}|{','.join(score_list)}"
-                            )
-                        else:
-                            # If no scores, just include accession (with name if available)
-                            formatted_parts.append(acc_with_name)
-
-                    processed_annotations[annotation_name] = ";".join(formatted_parts)
+                    # sorted by accession for consistency
+                    processed_annotations[annotation_name] = _format_accessions(
+                        by_accession
+                    )
                 else:
                     processed_annotations[annotation_name] = ""
 
@@ -459,26 +499,19 @@ class InterProRetriever(BaseAnnotationRetriever):
         try:
             cache_dir.mkdir(parents=True, exist_ok=True)
 
-            resp = requests.get(INTERPRO_XML_URL, timeout=120, stream=True)
-            resp.raise_for_status()
-
-            # Write to temp file first, then move atomically
-            tmp_gz = None
-            try:
-                fd, tmp_gz = tempfile.mkstemp(suffix=".xml.gz", dir=str(cache_dir))
-                os.close(fd)
-                with open(tmp_gz, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=1 << 20):
-                        f.write(chunk)
-
-                name_maps = cls._parse_interpro_xml(tmp_gz)
-            finally:
-                if tmp_gz and os.path.exists(tmp_gz):
-                    os.remove(tmp_gz)
+            # Decompress and parse while the bytes arrive; nothing hits disk
+            with (
+                retrying_session(pool_size=1) as session,
+                session.get(INTERPRO_XML_URL, timeout=120, stream=True) as resp,
+            ):
+                resp.raise_for_status()
+                resp.raw.decode_content = True  # undo any transfer encoding
+                name_maps = cls._parse_interpro_xml(resp.raw)
 
-            # Persist cache
-            cache_file.write_text(json.dumps(name_maps))
-            timestamp_file.write_text(str(time.time()))
+            # Persist cache. Map first, then timestamp: a crash in between
+            # leaves a fresh map marked old (re-download), never the reverse.
+            atomic_write_bytes(cache_file, json.dumps(name_maps).encode())
+            atomic_write_bytes(timestamp_file, str(time.time()).encode())
 
             logger.info("InterPro member-DB name map cached successfully")
             return name_maps
@@ -495,10 +528,13 @@ class InterProRetriever(BaseAnnotationRetriever):
             return {}
 
     @staticmethod
-    def _parse_interpro_xml(gz_path: str) -> dict[str, dict[str, str]]:
+    def _parse_interpro_xml(gz_source) -> dict[str, dict[str, str]]:
         """
         Stream-parse a gzipped InterPro XML file and extract member-DB names.
 
+        ``gz_source`` is a path or a binary file object (e.g. an HTTP
+        response stream) yielding the gzipped bytes.
+
         For each ``<interpro>`` element the parser captures the child
         ``<name>`` text (the InterPro entry name).  For every ``<db_xref>``
         whose ``db`` attribute is in :data:`_XML_DBS_OF_INTEREST`, the
@@ -510,7 +546,9 @@ class InterProRetriever(BaseAnnotationRetriever):
         """
         name_maps: dict[str, dict[str, str]] = {db: {} for db in _XML_DBS_OF_INTEREST}
 
-        with gzip.open(gz_path, "rb") as f:
+        with gzip.open(gz_source, "rb") as gz:
+            # Inflate in large blocks rather than many small reads
+            f = io.BufferedReader(gz, buffer_size=_GZIP_READ_BUFFER)
             context = ET.iterparse(f, events=("end",))
             for _event, elem in context:
                 if elem.tag == "interpro":
@@ -523,13 +561,15 @@ class InterProRetriever(BaseAnnotationRetriever):
                     )
 
                     for db_xref in elem.iter("db_xref"):
-                        db = db_xref.get("db", "")
-                        if db in _XML_DBS_OF_INTEREST:
-                            dbkey = db_xref.get("dbkey", "")
-                            xref_name = db_xref.get("name", "").strip()
-                            resolved_name = xref_name if xref_name else ipr_name
-                            if dbkey and resolved_name:
-                                name_maps[db][dbkey] = resolved_name
+                        # Filter on db first: most xrefs are other databases
+                        db = db_xref.get("db")
+                        if db not in _XML_DBS_OF_INTEREST:
+                            continue
+                        dbkey = db_xref.get("dbkey")
+                        xref_name = db_xref.get("name")
+                        resolved_name = (xref_name and xref_name.strip()) or ipr_name
+                        if dbkey and resolved_name:
+                            name_maps[db][dbkey] = resolved_name
 
                     # Free memory for processed elements
                     elem.clear()
@@ -543,7 +583,8 @@ class InterProRetriever(BaseAnnotationRetriever):
         Extract protein identifiers from FASTA headers.
 
         For UniProt headers like 'sp|P12345|PROTEIN_MOUSE', extracts 'P12345'
-        For other headers, uses the second part after splitting by '|'
+        For other headers, uses the second part after splitting by '|';
+        headers without '|' are kept as-is
 
         Args:
             headers: List of protein headers/identifiers
@@ -551,24 +592,9 @@ class InterProRetriever(BaseAnnotationRetriever):
         Returns:
             List of managed protein identifiers
         """
+        # UniProt (sp|/tr|) and other headers alike: take the second '|' field
         managed_headers = []
-        prefixes = ["sp|", "tr|"]
-
         for header in headers:
-            header_lower = header.lower()
-            if any(header_lower.startswith(prefix) for prefix in prefixes):
-                # For UniProt headers, extract the accession (second part)
-                parts = header.split("|")
-                if len(parts) >= 2:
-                    managed_headers.append(parts[1])
-                else:
-                    managed_headers.append(header)
-            else:
-                # For other headers, try to extract the second part after '|'
-                parts = header.split("|")
-                if len(parts) >= 2:
-                    managed_headers.append(parts[1])
-                else:
-                    managed_headers.append(header)
-
+            _, sep, rest = header.partition("|")
+            managed_headers.append(rest.partition("|")[0] if sep else header)
         return managed_headers
@@ -3,6 +3,7 @@ from typing import Any
 
 from tqdm import tqdm
 
+from protspace.data.annotations.catalog import TAXONOMY_ANNOTATIONS  # noqa: F401
 from protspace.data.annotations.retrievers.base_retriever import BaseAnnotationRetriever
 from protspace.data.annotations.retrievers.http_utils import paginated_get
 
@@ -11,19 +12,6 @@ logger = logging.getLogger(__name__)
 TAXONOMY_API_URL = "https://rest.uniprot.org/taxonomy/search"
 _BATCH_SIZE = 100  # Max taxon IDs per request (URL length safety)
 
-# Taxonomy annotations
-TAXONOMY_ANNOTATIONS = [
-    "root",
-    "domain",
-    "kingdom",
-    "phylum",
-    "class",
-    "order",
-    "family",
-    "genus",
-    "species",
-]
-
 
 class TaxonomyRetriever(BaseAnnotationRetriever):
     """Retrieves taxonomy lineage data from the UniProt Taxonomy API."""
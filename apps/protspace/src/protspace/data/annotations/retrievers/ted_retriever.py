@@ -5,17 +5,17 @@ import logging
 import requests
 from tqdm import tqdm
 
+from protspace.data.annotations.catalog import TED_ANNOTATIONS  # noqa: F401
 from protspace.data.annotations.encoding import encode_field
 from protspace.data.annotations.retrievers.base_retriever import BaseAnnotationRetriever
 from protspace.data.annotations.retrievers.cath_names import get_cath_names
+from protspace.data.annotations.types import ProteinAnnotations
 
 logger = logging.getLogger(__name__)
 
 ALPHAFOLD_DOMAINS_URL = "https://alphafold.ebi.ac.uk/api/domains"
 _API_TIMEOUT = 10
 
-TED_ANNOTATIONS = ["ted_domains"]
-
 
 class TedRetriever(BaseAnnotationRetriever):
     """Retrieves TED domain annotations from the AlphaFold Database API."""
@@ -26,12 +26,8 @@ class TedRetriever(BaseAnnotationRetriever):
         self.annotations = annotations
         self._cath_names = None
 
-    def fetch_annotations(self) -> list[tuple]:
+    def fetch_annotations(self) -> list[ProteinAnnotations]:
         """Fetch TED domain annotations for all proteins."""
-        from protspace.data.annotations.retrievers.uniprot_retriever import (
-            ProteinAnnotations,
-        )
-
         result = []
 
         with tqdm(
@@ -6,41 +6,18 @@ This module fetches protein annotations from the UniProt API.
 
 import logging
 import re
-from collections import namedtuple
 
 import requests
 from tqdm import tqdm
 
+from protspace.data.annotations.catalog import UNIPROT_ANNOTATIONS
 from protspace.data.annotations.retrievers.base_retriever import BaseAnnotationRetriever
 from protspace.data.annotations.retrievers.http_utils import API_TIMEOUT, paginated_get
+from protspace.data.annotations.types import ProteinAnnotations
 from protspace.data.parsers.uniprot_parser import UniProtEntry
 
 logger = logging.getLogger(__name__)
 
-# UniProt annotations - these are the current protspace annotations
-UNIPROT_ANNOTATIONS = [
-    "annotation_score",
-    "cc_subcellular_location",
-    "ec",
-    "fragment",
-    "gene_name",
-    "go_bp",
-    "go_cc",
-    "go_mf",
-    "keyword",
-    "length",
-    "organism_id",
-    "protein_name",
-    "protein_existence",
-    "protein_families",
-    "reviewed",
-    "sequence",
-    "uniprot_kb_id",
-    "xref_pdb",
-]
-
-ProteinAnnotations = namedtuple("ProteinAnnotations", ["identifier", "annotations"])
-
 
 def _fetch_one_with_timeout(accession: str, timeout: int = API_TIMEOUT) -> dict:
     """Fetch a single UniProt entry by accession with timeout protection."""
@@ -4,7 +4,10 @@ Moves the --no-scores presentation concern out of the retriever/parser layer
 and into the CLI output stage, so that cached data always retains full scores.
 """
 
+import re
+
 import pandas as pd
+from pandas.api.types import infer_dtype
 
 # Columns that may contain pipe-separated scores (evidence codes or bit scores).
 # UniProt evidence codes: value|CODE  (e.g. "Cytoplasm|EXP")
@@ -31,6 +34,9 @@ SCORE_BEARING_COLUMNS = [
     "ted_domains",
 ]
 
+# A score suffix runs from "|" to the end of its ";"-separated entry
+_SCORE_SUFFIX_RE = re.compile(r"\|[^;]*")
+
 
 def strip_scores_from_df(df: pd.DataFrame) -> pd.DataFrame:
     """Remove |score suffixes from all score-bearing columns in a DataFrame.
@@ -48,7 +54,13 @@ def strip_scores_from_df(df: pd.DataFrame) -> pd.DataFrame:
     for col in SCORE_BEARING_COLUMNS:
         if col not in df.columns:
             continue
-        df[col] = df[col].apply(_strip_scores_from_cell)
+        if infer_dtype(df[col], skipna=True) in ("string", "empty"):
+            # Drop everything from "|" up to the next ";" in one vectorised
+            # pass; same result as the per-cell split, without a Python call
+            # per row. NaN and "" pass through unchanged.
+            df[col] = df[col].str.replace(_SCORE_SUFFIX_RE, "", regex=True)
+        else:
+            df[col] = df[col].apply(_strip_scores_from_cell)
     return df
 
 
@@ -56,7 +68,4 @@ def _strip_scores_from_cell(value) -> str:
     """Strip |score from every semicolon-separated entry in a single cell value."""
     if pd.isna(value) or value == "":
         return value
-    value = str(value)
-    parts = value.split(";")
-    stripped = [part.split("|")[0] for part in parts]
-    return ";".join(stripped)
+    return _SCORE_SUFFIX_RE.sub("", str(value))
@@ -4,8 +4,6 @@ Main annotation transformer orchestrator.
 This module coordinates annotation transformations by delegating to specific transformers.
 """
 
-from collections import namedtuple
-
 from protspace.data.annotations.transformers.interpro_transforms import (
     InterProTransformer,
     _get_pfam_clan_mapping,
@@ -13,8 +11,7 @@ from protspace.data.annotations.transformers.interpro_transforms import (
 from protspace.data.annotations.transformers.uniprot_transforms import (
     UniProtTransformer,
 )
-
-ProteinAnnotations = namedtuple("ProteinAnnotations", ["identifier", "annotations"])
+from protspace.data.annotations.types import ProteinAnnotations
 
 
 class AnnotationTransformer:
@@ -25,6 +22,26 @@ class AnnotationTransformer:
         self.interpro_transformer = InterProTransformer()
         self._ec_name_map = None
         self._pfam_clan_map = None
+        # (annotation, transform) pairs, built once and applied in order to
+        # each protein's annotations that are present. pfam_clan is derived
+        # from the transformed pfam value, so it is handled separately.
+        uniprot, interpro = self.uniprot_transformer, self.interpro_transformer
+        self._field_transforms = (
+            # UniProt transformations
+            ("annotation_score", uniprot.transform_annotation_score),
+            ("protein_families", uniprot.transform_protein_families),
+            ("xref_pdb", uniprot.transform_xref_pdb),
+            ("fragment", uniprot.transform_fragment),
+            ("cc_subcellular_location", uniprot.transform_cc_subcellular_location),
+            ("go_mf", uniprot.transform_go_terms),
+            ("go_bp", uniprot.transform_go_terms),
+            ("go_cc", uniprot.transform_go_terms),
+            ("ec", self._transform_ec),
+            # InterPro transformations
+            ("cath", interpro.transform_cath),
+            ("signal_peptide", interpro.transform_signal_peptide),
+            ("pfam", interpro.transform_pfam),
+        )
 
     def transform(self, proteins: list[ProteinAnnotations]) -> list[ProteinAnnotations]:
         """
@@ -60,68 +77,9 @@ class AnnotationTransformer:
         """
         transformed = annotations.copy()
 
-        # UniProt transformations
-        if "annotation_score" in transformed:
-            transformed["annotation_score"] = (
-                self.uniprot_transformer.transform_annotation_score(
-                    transformed["annotation_score"]
-                )
-            )
-
-        if "protein_families" in transformed:
-            transformed["protein_families"] = (
-                self.uniprot_transformer.transform_protein_families(
-                    transformed["protein_families"]
-                )
-            )
-
-        if "xref_pdb" in transformed:
-            transformed["xref_pdb"] = self.uniprot_transformer.transform_xref_pdb(
-                transformed["xref_pdb"]
-            )
-
-        if "fragment" in transformed:
-            transformed["fragment"] = self.uniprot_transformer.transform_fragment(
-                transformed["fragment"]
-            )
-
-        if "cc_subcellular_location" in transformed:
-            transformed["cc_subcellular_location"] = (
-                self.uniprot_transformer.transform_cc_subcellular_location(
-                    transformed["cc_subcellular_location"]
-                )
-            )
-
-        for go_key in ("go_mf", "go_bp", "go_cc"):
-            if go_key in transformed:
-                transformed[go_key] = self.uniprot_transformer.transform_go_terms(
-                    transformed[go_key]
-                )
-
-        if "ec" in transformed:
-            if self._ec_name_map is None:
-                self._ec_name_map = UniProtTransformer._get_ec_name_map()
-            transformed["ec"] = self.uniprot_transformer.transform_ec(
-                transformed["ec"], self._ec_name_map
-            )
-
-        # InterPro transformations
-        if "cath" in transformed:
-            transformed["cath"] = self.interpro_transformer.transform_cath(
-                transformed["cath"]
-            )
-
-        if "signal_peptide" in transformed:
-            transformed["signal_peptide"] = (
-                self.interpro_transformer.transform_signal_peptide(
-                    transformed["signal_peptide"]
-                )
-            )
-
-        if "pfam" in transformed:
-            transformed["pfam"] = self.interpro_transformer.transform_pfam(
-                transformed["pfam"]
-            )
+        for key, transform in self._field_transforms:
+            if key in transformed:
+                transformed[key] = transform(transformed[key])
 
         if "pfam_clan" in transformed:
             if self._pfam_clan_map is None:
@@ -132,6 +90,12 @@ class AnnotationTransformer:
 
         return transformed
 
+    def _transform_ec(self, value: str) -> str:
+        """Transform an EC value, loading the EC name map on first use."""
+        if self._ec_name_map is None:
+            self._ec_name_map = UniProtTransformer._get_ec_name_map()
+        return self.uniprot_transformer.transform_ec(value, self._ec_name_map)
+
     def transform_row(self, row: list, headers: list[str]) -> list:
         """
         Transform a row of data (used for CSV/Parquet writing).
@@ -0,0 +1,13 @@
+"""Shared record types for annotation retrieval and merging."""
+
+from dataclasses import dataclass
+
+
+# Not frozen: frozen dataclasses initialise through object.__setattr__, which
+# makes construction (one per protein per source) slower than a namedtuple.
+@dataclass(slots=True)
+class ProteinAnnotations:
+    """Annotations fetched for one protein: ``{annotation_name: value}``."""
+
+    identifier: str
+    annotations: dict
@@ -4,12 +4,10 @@ Data formatters for different output types.
 This module provides utilities for formatting data into different structures.
 """
 
-from collections import namedtuple
-
 import pandas as pd
 import pyarrow as pa
 
-ProteinAnnotations = namedtuple("ProteinAnnotations", ["identifier", "annotations"])
+from protspace.data.annotations.types import ProteinAnnotations
 
 
 class DataFormatter:
@@ -5,12 +5,16 @@ This module provides functionality for writing annotation data to various format
 """
 
 import csv
-from collections import namedtuple
 from pathlib import Path
 
 import pandas as pd
 
-ProteinAnnotations = namedtuple("ProteinAnnotations", ["identifier", "annotations"])
+from protspace.data.annotations.types import ProteinAnnotations
+
+# Parquet options for the annotation cache. Bounded row groups let readers
+# (e.g. --dump-cache) stream it batch by batch; zstd keeps the many repeated
+# annotation strings small. The cache is only read back through pyarrow.
+PARQUET_WRITE_OPTIONS = {"compression": "zstd", "row_group_size": 65_536}
 
 
 class AnnotationWriter:
@@ -82,7 +86,7 @@ class AnnotationWriter:
         if not proteins:
             # Write empty DataFrame
             df = pd.DataFrame(columns=["identifier"])
-            df.to_parquet(path, index=False)
+            df.to_parquet(path, index=False, **PARQUET_WRITE_OPTIONS)
             return
 
         # Convert to rows
@@ -102,4 +106,4 @@ class AnnotationWriter:
 
         # Create DataFrame and write
         df = pd.DataFrame(data_rows, columns=csv_headers)
-        df.to_parquet(path, index=False)
+        df.to_parquet(path, index=False, **PARQUET_WRITE_OPTIONS)
@@ -1,33 +1,34 @@
-"""Composable input loaders for the ProtSpace pipeline."""
-
-from protspace.data.loaders.embedding_set import (
-    EmbeddingSet,
-    format_projection_name,
-    merge_same_name_sets,
-)
-from protspace.data.loaders.fasta import embed_fasta
-from protspace.data.loaders.h5 import (
-    EMBEDDING_EXTENSIONS,
-    load_h5,
-    parse_identifier,
-    split_h5_spec,
-)
-from protspace.data.loaders.query import (
-    extract_identifiers_from_fasta,
-    query_uniprot,
-)
-from protspace.data.loaders.similarity import compute_similarity
-
-__all__ = [
-    "EMBEDDING_EXTENSIONS",
-    "EmbeddingSet",
-    "format_projection_name",
-    "merge_same_name_sets",
-    "compute_similarity",
-    "embed_fasta",
-    "extract_identifiers_from_fasta",
-    "load_h5",
-    "parse_identifier",
-    "query_uniprot",
-    "split_h5_spec",
-]
+"""Composable input loaders for the ProtSpace pipeline.
+
+Exports are resolved lazily: importing one loader (e.g. EmbeddingSet for the
+pipeline) does not pull in requests, h5py, or the embedding backends.
+"""
+
+_EXPORTS = {
+    "EMBEDDING_EXTENSIONS": "protspace.data.loaders.h5",
+    "EmbeddingSet": "protspace.data.loaders.embedding_set",
+    "format_projection_name": "protspace.data.loaders.embedding_set",
+    "merge_same_name_sets": "protspace.data.loaders.embedding_set",
+    "compute_similarity": "protspace.data.loaders.similarity",
+    "embed_fasta": "protspace.data.loaders.fasta",
+    "extract_identifiers_from_fasta": "protspace.data.loaders.query",
+    "load_h5": "protspace.data.loaders.h5",
+    "parse_identifier": "protspace.data.loaders.h5",
+    "query_uniprot": "protspace.data.loaders.query",
+    "split_h5_spec": "protspace.data.loaders.h5",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(_EXPORTS)
+
+
+__all__ = list(_EXPORTS)
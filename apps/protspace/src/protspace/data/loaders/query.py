@@ -5,8 +5,12 @@ and _extract_identifiers_from_fasta*.
 """
 
 import gzip
+import hashlib
 import logging
+import os
+import shutil
 import tempfile
+import time
 from pathlib import Path
 
 import requests
@@ -14,21 +18,96 @@ from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
+# Downloaded query results, keyed by a hash of the query string. UniProt
+# releases every ~8 weeks, but entries are edited in between, so keep it short.
+QUERY_CACHE_DIR = Path.home() / ".cache" / "protspace" / "queries"
+QUERY_CACHE_MAX_AGE_HOURS = 24
+
+
+def _query_cache_path(query: str) -> Path:
+    digest = hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+    return QUERY_CACHE_DIR / f"{digest}.fasta"
+
+
+def _load_cached_query(query: str, save_to: Path | None):
+    """Return (identifiers, fasta_path) for a fresh cached query, else None."""
+    cached = _query_cache_path(query)
+    try:
+        stat = cached.stat()
+    except OSError:
+        return None
+    age_hours = (time.time() - stat.st_mtime) / 3600
+    if stat.st_size == 0 or age_hours >= QUERY_CACHE_MAX_AGE_HOURS:
+        return None
+
+    identifiers = extract_identifiers_from_fasta(cached)
+    if save_to:
+        save_to.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached, save_to)
+        cached = save_to
+    logger.info(f"Using cached query result ({len(identifiers)} sequences)")
+    return identifiers, cached
+
+
+def _store_cached_query(query: str, fasta_path: Path) -> None:
+    """Copy *fasta_path* into the query cache and prune expired entries.
+
+    The copy goes to a sibling temp file that is fsynced and renamed into
+    place, so an interrupted run cannot leave a truncated FASTA that would
+    be reused as the full result.
+    """
+    cached = _query_cache_path(query)
+    tmp = None
+    try:
+        QUERY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _prune_query_cache()
+        fd, name = tempfile.mkstemp(dir=QUERY_CACHE_DIR, prefix=f".{cached.name}.")
+        os.close(fd)
+        tmp = Path(name)
+        shutil.copyfile(fasta_path, tmp)
+        with open(tmp, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp, cached)
+    except OSError as e:
+        logger.warning(f"Could not cache query result: {e}")
+    finally:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+
+
+def _prune_query_cache() -> None:
+    """Delete cached queries, and temp files left by crashed runs, once expired."""
+    cutoff = time.time() - QUERY_CACHE_MAX_AGE_HOURS * 3600
+    for entry in QUERY_CACHE_DIR.iterdir():
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            continue
+
 
 def query_uniprot(
     query: str,
     *,
     save_to: Path | None = None,
+    use_cache: bool = True,
 ) -> tuple[list[str], Path]:
     """Search UniProt and download FASTA.
 
     Args:
         query: UniProt search query string.
         save_to: If provided, save extracted FASTA here. Otherwise uses a temp file.
+        use_cache: Reuse a download of the same query from the last
+            QUERY_CACHE_MAX_AGE_HOURS hours instead of hitting UniProt again.
 
     Returns:
         Tuple of (identifiers, fasta_path).
     """
+    if use_cache:
+        cached = _load_cached_query(query, save_to)
+        if cached is not None:
+            return cached
+
     logger.info(f"Searching UniProt for query: '{query}'")
 
     base_url = "https://rest.uniprot.org/uniprotkb/stream"
@@ -48,15 +127,14 @@ def query_uniprot(
         with tqdm(
             total=total_size, unit="B", unit_scale=True, desc="Downloading FASTA"
         ) as pbar:
-            for chunk in response.iter_content(chunk_size=8192):
+            # 1 MiB chunks: a large query is hundreds of MB; 8 KiB chunks
+            # meant a Python-level write and progress update per 8 KiB
+            for chunk in response.iter_content(chunk_size=1 << 20):
                 if chunk:
                     temp_file.write(chunk)
                     pbar.update(len(chunk))
         temp_file.close()
 
-        # Extract identifiers from compressed FASTA
-        identifiers = _extract_identifiers_gz(temp_gz_file)
-
         # Extract FASTA to final location
         if save_to:
             extracted_path = save_to
@@ -64,13 +142,12 @@ def query_uniprot(
         else:
             extracted_path = temp_gz_file.with_suffix("")
 
-        with gzip.open(temp_gz_file, "rt") as gz_file:
-            content = gz_file.read()
-            with open(extracted_path, "w") as out:
-                out.write(content)
+        identifiers = _extract_fasta_gz(temp_gz_file, extracted_path)
 
         temp_gz_file.unlink(missing_ok=True)
         logger.info(f"Downloaded and extracted {len(identifiers)} sequences")
+        if identifiers:
+            _store_cached_query(query, extracted_path)
 
         return identifiers, extracted_path
 
@@ -95,13 +172,18 @@ def extract_identifiers_from_fasta(fasta_path: Path) -> list[str]:
     return identifiers
 
 
-def _extract_identifiers_gz(fasta_gz_path: Path) -> list[str]:
-    """Extract protein identifiers from a gzipped FASTA file."""
+def _extract_fasta_gz(fasta_gz_path: Path, out_path: Path) -> list[str]:
+    """Decompress a gzipped FASTA to *out_path*, returning its identifiers.
+
+    One streaming pass: the archive is not decompressed a second time just to
+    read the headers, and the whole FASTA is never held in memory.
+    """
     from protspace.data.loaders.h5 import parse_identifier
 
     identifiers = []
-    with gzip.open(fasta_gz_path, "rt") as f:
+    with gzip.open(fasta_gz_path, "rt") as f, open(out_path, "w") as out:
         for line in f:
+            out.write(line)
             if line.startswith(">"):
                 raw = line[1:].strip().split()[0]
                 identifiers.append(parse_identifier(raw))
@@ -2,9 +2,28 @@
 
 - BaseProcessor: Core dimensionality reduction and output creation
 - ReductionPipeline: Unified pipeline composing loaders + DR + output
+
+Exports are resolved lazily: BaseProcessor pulls in pandas/pyarrow, which
+the pipeline's method-spec parsing does not need.
 """
 
-from protspace.data.processors.base_processor import BaseProcessor
-from protspace.data.processors.pipeline import PipelineConfig, ReductionPipeline
+_EXPORTS = {
+    "BaseProcessor": "protspace.data.processors.base_processor",
+    "PipelineConfig": "protspace.data.processors.pipeline",
+    "ReductionPipeline": "protspace.data.processors.pipeline",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(_EXPORTS)
+
 
-__all__ = ["BaseProcessor", "PipelineConfig", "ReductionPipeline"]
+__all__ = list(_EXPORTS)
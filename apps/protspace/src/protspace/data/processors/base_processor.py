@@ -1,6 +1,7 @@
 import json
 import logging
 import warnings
+from dataclasses import fields
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +21,11 @@ from protspace.utils.constants import MDS_NAME, DimensionReductionConfig
 
 logger = logging.getLogger(__name__)
 
+# Config keys forwarded to DimensionReductionConfig (dims come from the method spec)
+_REDUCTION_CONFIG_KEYS = frozenset(
+    f.name for f in fields(DimensionReductionConfig) if f.name != "n_components"
+)
+
 
 class BaseProcessor:
     """Base class containing common data processing methods."""
@@ -35,22 +41,8 @@ class BaseProcessor:
     ) -> dict[str, Any]:
         """Process a single reduction method."""
         # Filter config to only include parameters accepted by DimensionReductionConfig
-        valid_config_keys = {
-            "n_neighbors",
-            "metric",
-            "precomputed",
-            "min_dist",
-            "perplexity",
-            "learning_rate",
-            "mn_ratio",
-            "fp_ratio",
-            "n_init",
-            "max_iter",
-            "eps",
-            "random_state",
-        }
         filtered_config = {
-            k: v for k, v in self.config.items() if k in valid_config_keys
+            k: v for k, v in self.config.items() if k in _REDUCTION_CONFIG_KEYS
         }
         config = DimensionReductionConfig(n_components=dims, **filtered_config)
 
@@ -6,23 +6,29 @@ Composes: loaders → annotation fetch → dimensionality reduction → output.
 import hashlib
 import json
 import logging
+import os
+import re
 import shutil
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
 
 from protspace.data.loaders import EmbeddingSet
 from protspace.data.loaders.embedding_set import (
     format_param_suffix,
     format_projection_name,
 )
-from protspace.data.processors.base_processor import BaseProcessor
 from protspace.utils import get_reducers
-from protspace.utils.constants import MDS_NAME
+from protspace.utils.constants import MDS_NAME, PCA_NAME, REDUCER_METHODS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from protspace.data.processors.base_processor import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
@@ -80,12 +86,18 @@ class PipelineConfig:
     annotations: list[str] | None = None
     intermediate_dir: Path | None = None
     reducer_params: ReducerParams = field(default_factory=ReducerParams)
+    max_workers: int = 1  # parallel reduction processes per embedding set
 
 
 # Valid override parameter names (from ReducerParams fields)
 _VALID_OVERRIDE_KEYS = {f.name for f in fields(ReducerParams)}
 # Field types for coercion
 _FIELD_TYPES = {f.name: f.type for f in fields(ReducerParams)}
+# -a values with these suffixes are user annotation files, not names. Decided
+# by suffix alone so no annotation name ever costs a filesystem stat.
+ANNOTATION_FILE_SUFFIXES = (".csv", ".tsv")
+# Method name followed by dimension count, e.g. "umap2"
+_SPEC_RE = re.compile(r"([A-Za-z]+)(\d+)")
 
 
 def _coerce_value(key: str, raw: str) -> int | float | str:
@@ -111,8 +123,13 @@ def parse_method_spec(method_spec: str) -> MethodSpec:
     else:
         base, params_str = method_spec, ""
 
-    method = "".join(filter(str.isalpha, base))
-    dims = int("".join(filter(str.isdigit, base)))
+    match = _SPEC_RE.fullmatch(base.strip())
+    if match is None:
+        raise ValueError(
+            f"Invalid method spec '{method_spec}'. Expected <method><dims>, "
+            f"e.g. 'pca2'."
+        )
+    method, dims = match.group(1).lower(), int(match.group(2))
 
     overrides = {}
     if params_str:
@@ -147,18 +164,31 @@ def parse_methods_arg(raw: list[str]) -> list[MethodSpec]:
     Each element may be comma-separated: "pca2,umap2:n_neighbors=50"
     Semicolons separate parameters within a method override.
     """
-    specs: list[MethodSpec] = []
-    seen: set[MethodSpec] = set()
-    for item in raw:
-        for part in item.split(","):
-            part = part.strip()
-            if not part:
-                continue
-            spec = parse_method_spec(part)
-            if spec not in seen:
-                seen.add(spec)
-                specs.append(spec)
-    return specs
+    # Insertion-ordered dedup: accidental repeats ("pca2,pca2") run once.
+    return list(
+        dict.fromkeys(
+            parse_method_spec(part)
+            for item in raw
+            for part in map(str.strip, item.split(","))
+            if part
+        )
+    )
+
+
+def drop_unknown_methods(
+    specs: list[MethodSpec], known: Iterable[str] = REDUCER_METHODS
+) -> list[MethodSpec]:
+    """Drop specs whose method has no reducer, warning once for all of them.
+
+    Run before any heavy work (embedding, annotation fetch, DR) so a typo in
+    the method list is reported up front instead of between long-running
+    reductions.
+    """
+    unknown = {spec.method for spec in specs}.difference(known)
+    if not unknown:
+        return specs
+    logger.warning("Unknown method(s): %s. Skipping.", ", ".join(sorted(unknown)))
+    return [spec for spec in specs if spec.method not in unknown]
 
 
 def disambiguation_suffix(spec: MethodSpec, method_counts: Counter) -> str:
@@ -177,8 +207,17 @@ def disambiguation_suffix(spec: MethodSpec, method_counts: Counter) -> str:
     return ""
 
 
+def headers_digest(headers: list[str]) -> str:
+    """Order-sensitive fingerprint of a header list.
+
+    Projection rows follow header order, so the order is part of the key. The
+    headers are encoded in one joined buffer rather than one update per id.
+    """
+    return hashlib.blake2b("\n".join(headers).encode(), digest_size=16).hexdigest()
+
+
 def _run_with_overridden_config(
-    base: BaseProcessor,
+    base: "BaseProcessor",
     effective_params: dict[str, Any],
     method: str,
     dims: int,
@@ -198,6 +237,171 @@ def _run_with_overridden_config(
         base.config = saved
 
 
+# Per-process state for parallel reduction workers, set once by the pool
+# initializer. The data matrix lives in one shared-memory block that every
+# worker maps, so it is neither pickled nor copied per worker.
+_worker_base: "BaseProcessor | None" = None
+_worker_data: np.ndarray | None = None
+_worker_shm = None  # keeps the mapping alive for as long as _worker_data
+
+
+def _init_reduction_worker(
+    base: "BaseProcessor",
+    shm_name: str,
+    shape: tuple[int, ...],
+    dtype: str,
+    blas_threads: int,
+) -> None:
+    global _worker_base, _worker_data, _worker_shm
+    from multiprocessing import shared_memory
+
+    import numba
+    from threadpoolctl import threadpool_limits
+
+    # Split the cores between workers instead of letting every worker's
+    # BLAS/OpenMP pool claim all of them. threadpoolctl does not reach
+    # numba's own pool (TBB/OpenMP/workqueue layer), which runs the UMAP,
+    # PaCMAP and LocalMAP kernels, so cap that one separately.
+    threadpool_limits(blas_threads)
+    numba.set_num_threads(min(blas_threads, numba.config.NUMBA_NUM_THREADS))
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    data = np.ndarray(shape, dtype=dtype, buffer=_worker_shm.buf)
+    # Shared by every concurrent reduction: no reducer may write to it.
+    data.flags.writeable = False
+    _worker_base, _worker_data = base, data
+
+
+def _reduce_in_worker(
+    method: str, dims: int, effective_params: dict[str, Any]
+) -> dict[str, Any]:
+    return _run_with_overridden_config(
+        _worker_base, effective_params, method, dims, _worker_data
+    )
+
+
+def _nested_pca_sources(jobs: list[tuple[str, int, dict[str, Any]]]) -> dict[int, int]:
+    """Map each PCA job index that can be sliced from a wider PCA job to it.
+
+    PCA components are nested: the first d columns of a k-component fit are
+    the d-component fit. Among PCA jobs with identical parameters only the
+    widest is fitted.
+    """
+    widest: dict[tuple, int] = {}
+    for i, (method, dims, params) in enumerate(jobs):
+        if method == PCA_NAME:
+            key = tuple(sorted(params.items()))
+            if key not in widest or dims > jobs[widest[key]][1]:
+                widest[key] = i
+    sources = {}
+    for i, (method, _, params) in enumerate(jobs):
+        if method == PCA_NAME:
+            source = widest[tuple(sorted(params.items()))]
+            if source != i:
+                sources[i] = source
+    return sources
+
+
+def _slice_pca(base: "BaseProcessor", reduction: dict, dims: int) -> dict[str, Any]:
+    """Derive a ``dims``-component PCA reduction from a wider one."""
+    info = {**reduction["info"], "n_components": dims}
+    if "explained_variance_ratio" in info:
+        info["explained_variance_ratio"] = info["explained_variance_ratio"][:dims]
+    return {
+        "name": base.custom_names.get(f"{PCA_NAME}{dims}", f"PCA_{dims}"),
+        "dimensions": dims,
+        "info": info,
+        "data": np.ascontiguousarray(reduction["data"][:, :dims]),
+    }
+
+
+def _run_reduction_batch(
+    base: "BaseProcessor",
+    data: np.ndarray,
+    jobs: list[tuple[str, int, dict[str, Any]]],
+    *,
+    label: str = "",
+    max_workers: int = 1,
+) -> list[dict[str, Any]]:
+    """Run several independent reductions on the same data matrix.
+
+    ``jobs`` holds ``(method, dims, effective_params)`` triples; results come
+    back in job order. Preprocessing that does not depend on the method (the
+    float16 → float32 upcast) is done once for the whole batch instead of once
+    per reduction, and PCA is fitted once at the widest requested dimension,
+    narrower PCA projections being sliced from it.
+
+    With ``max_workers > 1`` the jobs run concurrently in a spawned process
+    pool (processes, not threads: UMAP/PaCMAP's numba kernels are not safe to
+    launch from several threads, and ``base.config`` is swapped per job).
+    Wall time then approaches the slowest reduction instead of the sum.
+    """
+    if not jobs:
+        # Fully cached: nothing to fit, so don't pay for the upcast copy
+        return []
+    if data.dtype == np.float16:
+        data = data.astype(np.float32)
+
+    sliced = _nested_pca_sources(jobs)
+    fitted = [i for i in range(len(jobs)) if i not in sliced]
+    results = dict(
+        zip(
+            fitted,
+            _fit_reductions(base, data, [jobs[i] for i in fitted], label, max_workers),
+            strict=True,
+        )
+    )
+    for i, source in sliced.items():
+        dims = jobs[i][1]
+        logger.info("Taking PCA %d from PCA %d for '%s'", dims, jobs[source][1], label)
+        results[i] = _slice_pca(base, results[source], dims)
+    return [results[i] for i in range(len(jobs))]
+
+
+def _fit_reductions(
+    base: "BaseProcessor",
+    data: np.ndarray,
+    jobs: list[tuple[str, int, dict[str, Any]]],
+    label: str,
+    max_workers: int,
+) -> list[dict[str, Any]]:
+    """Fit each job, sequentially or in a process pool; results in job order."""
+    # More processes than cores only adds contention and BLAS oversubscription
+    workers = min(max_workers, len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        reductions = []
+        for method, dims, effective_params in jobs:
+            logger.info("Applying %s %d to '%s'", method.upper(), dims, label)
+            reductions.append(
+                _run_with_overridden_config(base, effective_params, method, dims, data)
+            )
+        return reductions
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    blas_threads = max(1, (os.cpu_count() or 1) // workers)
+    shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+    try:
+        np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[...] = data
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_reduction_worker,
+            initargs=(base, shm.name, data.shape, data.dtype.str, blas_threads),
+        ) as pool:
+            futures = []
+            for method, dims, effective_params in jobs:
+                logger.info("Applying %s %d to '%s'", method.upper(), dims, label)
+                futures.append(
+                    pool.submit(_reduce_in_worker, method, dims, effective_params)
+                )
+            return [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 class ReductionPipeline:
     """Unified pipeline: load → annotate → reduce → output.
 
@@ -209,6 +413,8 @@ class ReductionPipeline:
     def __init__(self, config: PipelineConfig):
         self.config = config
         reducer_dict = asdict(config.reducer_params)
+        from protspace.data.processors.base_processor import BaseProcessor
+
         self.base = BaseProcessor(reducer_dict, get_reducers())
 
     def run(self, embedding_sets: list[EmbeddingSet]) -> Path:
@@ -223,6 +429,10 @@ class ReductionPipeline:
         if not embedding_sets:
             raise ValueError("At least one EmbeddingSet is required.")
 
+        self.config.methods = drop_unknown_methods(
+            self.config.methods, self.base.reducers
+        )
+
         # Merge same-name embedding sets (union their proteins)
         from protspace.data.loaders.embedding_set import merge_same_name_sets
 
@@ -241,18 +451,7 @@ class ReductionPipeline:
             metadata = strip_scores_from_df(metadata)
 
         # Build full metadata with all headers
-        full_metadata = pd.DataFrame({"identifier": all_headers})
-        if len(metadata.columns) > 1:
-            metadata = metadata.astype(str)
-            id_col = metadata.columns[0]
-            if id_col != "identifier":
-                metadata = metadata.rename(columns={id_col: "identifier"})
-            full_metadata = full_metadata.merge(
-                metadata.drop_duplicates("identifier"),
-                on="identifier",
-                how="left",
-            )
-        metadata = full_metadata
+        metadata = self._align_metadata(metadata, all_headers)
 
         # DR: each embedding set × each method
         all_reductions = self._run_reductions(embedding_sets)
@@ -277,11 +476,12 @@ class ReductionPipeline:
         )
 
         logger.info(
-            f"Processed {len(all_headers)} proteins, "
-            f"{len(embedding_sets)} embedding(s), "
-            f"{len(all_reductions)} projection(s)"
+            "Processed %d proteins, %d embedding(s), %d projection(s)",
+            len(all_headers),
+            len(embedding_sets),
+            len(all_reductions),
         )
-        logger.info(f"Output saved to: {self.config.output_path}")
+        logger.info("Output saved to: %s", self.config.output_path)
 
         # Clean up intermediate dir if not keeping
         if (
@@ -306,6 +506,48 @@ class ReductionPipeline:
                 sequences.update({parse_identifier(h): s for h, s in raw.items()})
         return sequences
 
+    @staticmethod
+    def _align_metadata(metadata: "pd.DataFrame", headers: list[str]) -> "pd.DataFrame":
+        """Return one metadata row per header, in header order.
+
+        The first column of ``metadata`` is taken as the identifier. Only
+        rows matching a header are stringified; headers without metadata
+        get NaN.
+        """
+        import pandas as pd
+
+        if len(metadata.columns) <= 1:
+            return pd.DataFrame({"identifier": headers})
+
+        id_col = metadata.columns[0]
+        if id_col != "identifier":
+            metadata = metadata.rename(columns={id_col: "identifier"})
+        ids = metadata["identifier"].astype(str)
+        # Annotation sources usually return exactly the requested headers in
+        # order; then there is nothing to dedup, filter or reindex.
+        aligned = len(ids) == len(headers) and ids.tolist() == headers
+        metadata = metadata.drop(columns="identifier").set_index(ids)
+        if not aligned:
+            if not metadata.index.is_unique:
+                metadata = metadata[~metadata.index.duplicated()]
+            metadata = metadata[metadata.index.isin(headers)]
+        # Columns that already hold only str (the usual case for API
+        # annotations) need no per-cell str() pass.
+        to_cast = [
+            col
+            for col, dtype in metadata.dtypes.items()
+            if not isinstance(dtype, pd.StringDtype)
+            and pd.api.types.infer_dtype(metadata[col], skipna=False) != "string"
+        ]
+        if to_cast:
+            metadata = metadata.astype(dict.fromkeys(to_cast, str))
+        if aligned:
+            return metadata.reset_index()
+        # Keep pandas' default string dtype for the identifier: a
+        # "string[pyarrow]" index with NA semantics made this isin/reindex
+        # path ~8x slower on 500k headers.
+        return metadata.reindex(pd.Index(headers, name="identifier")).reset_index()
+
     def _validate_headers(self, embedding_sets: list[EmbeddingSet]) -> list[str]:
         """Ensure all embedding sets share the same identifiers.
 
@@ -329,27 +571,32 @@ class ReductionPipeline:
             diff = set(es.headers) - common
             if diff:
                 logger.warning(
-                    f"Embedding '{es.name}': dropping {len(diff)} proteins "
-                    f"not present in all sets."
+                    "Embedding '%s': dropping %d proteins not present in all sets.",
+                    es.name,
+                    len(diff),
                 )
 
         # Use the order from the first set, filtered to common
         common_headers = [h for h in embedding_sets[0].headers if h in common]
 
-        # Re-order data in each set to match common_headers
+        # Re-order data in each set to match common_headers. Every set ends
+        # up holding the same list object, so per-set work keyed on the
+        # headers (the projection cache digest) can be shared.
         for es in embedding_sets:
             if es.headers != common_headers:
                 idx_map = {h: i for i, h in enumerate(es.headers)}
                 indices = [idx_map[h] for h in common_headers]
                 es.data = es.data[indices]
-                es.headers = common_headers
+            es.headers = common_headers
 
         return common_headers
 
     def _fetch_annotations(
         self, headers: list[str], embedding_sets: list[EmbeddingSet] = None
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """Fetch annotations from APIs with incremental caching support."""
+        import pandas as pd
+
         from protspace.data.annotations.manager import ProteinAnnotationManager
 
         # Extract sequences from FASTA files (if available) to avoid re-fetching
@@ -360,10 +607,10 @@ class ReductionPipeline:
         # Load user CSV if provided
         csv_df = None
         if csv_path:
-            logger.info(f"Loading custom annotations from: {csv_path}")
+            logger.info("Loading custom annotations from: %s", csv_path)
             csv_df = pd.read_csv(
                 csv_path,
-                sep="\t" if csv_path.endswith(".tsv") else ",",
+                sep="\t" if csv_path.lower().endswith(".tsv") else ",",
             )
             id_col = csv_df.columns[0]
             if id_col != "identifier":
@@ -447,24 +694,23 @@ class ReductionPipeline:
                     # Override with explicitly requested sources
                     sources = {src: src in refetch for src in _ANN_SOURCES}
                     refetched = [s for s in _ANN_SOURCES if sources[s]]
-                    logger.info(f"--refetch: re-fetching {', '.join(refetched)}")
+                    logger.info("--refetch: re-fetching %s", ", ".join(refetched))
                     # Drop cached columns for refetched sources so manager
-                    # re-fetches them
-                    from protspace.data.annotations.configuration import (
-                        AnnotationConfiguration as AnnCfg,
-                    )
-
-                    cols_to_drop = set()
-                    for src in refetched:
-                        cols_to_drop |= AnnCfg.categorize_annotations_by_source(
+                    # re-fetches them (bucket the cached columns once)
+                    by_source = (
+                        AnnotationConfiguration.categorize_annotations_by_source(
                             cached_annotations
-                        ).get(src, set())
+                        )
+                    )
+                    cols_to_drop = set().union(
+                        *(by_source.get(src, set()) for src in refetched)
+                    )
                     if cols_to_drop:
                         cached_df = cached_df.drop(
                             columns=[c for c in cols_to_drop if c in cached_df.columns]
                         )
                 else:
-                    logger.info(f"Missing annotations: {missing}")
+                    logger.info("Missing annotations: %s", missing)
 
                 api_df = ProteinAnnotationManager(
                     headers=headers,
@@ -507,7 +753,7 @@ class ReductionPipeline:
             item = item.strip()
             if not item:
                 continue
-            if item.endswith((".csv", ".tsv")):
+            if item.lower().endswith(ANNOTATION_FILE_SUFFIXES):
                 csv_path = item
             else:
                 for part in item.split(","):
@@ -517,7 +763,9 @@ class ReductionPipeline:
         return names, csv_path
 
     @staticmethod
-    def _merge_csv(api_df: pd.DataFrame, csv_df: pd.DataFrame | None) -> pd.DataFrame:
+    def _merge_csv(
+        api_df: "pd.DataFrame", csv_df: "pd.DataFrame | None"
+    ) -> "pd.DataFrame":
         """Merge user CSV annotations onto API annotations. CSV wins on collision."""
         if csv_df is None:
             return api_df
@@ -546,6 +794,7 @@ class ReductionPipeline:
         method: str,
         dims: int,
         effective_params: dict[str, Any] | None = None,
+        headers_key: str = "",
     ) -> Path | None:
         cache_dir = self.config.intermediate_dir
         if not cache_dir or not self.config.keep_tmp:
@@ -556,6 +805,9 @@ class ReductionPipeline:
             "dims": dims,
             "params": effective_params or asdict(self.config.reducer_params),
         }
+        if headers_key:
+            # A changed protein set must not reuse rows computed for another.
+            key_dict["headers"] = headers_key
         key_json = json.dumps(key_dict, sort_keys=True, default=str)
         h = hashlib.sha256(key_json.encode()).hexdigest()[:12]
         return cache_dir / f"proj_{embedding_name}_{method}{dims}_{h}.npz"
@@ -567,9 +819,10 @@ class ReductionPipeline:
         dims: int,
         effective_params: dict[str, Any] | None = None,
         param_suffix: str = "",
+        headers_key: str = "",
     ) -> dict[str, Any] | None:
         path = self._projection_cache_path(
-            embedding_name, method, dims, effective_params
+            embedding_name, method, dims, effective_params, headers_key
         )
         if (
             path is None
@@ -599,9 +852,10 @@ class ReductionPipeline:
         dims: int,
         reduction: dict,
         effective_params: dict[str, Any] | None = None,
+        headers_key: str = "",
     ) -> None:
         path = self._projection_cache_path(
-            embedding_name, method, dims, effective_params
+            embedding_name, method, dims, effective_params, headers_key
         )
         if path is None:
             return
@@ -634,16 +888,25 @@ class ReductionPipeline:
             reduction["source"] = emb_set.name
             all_reductions.append(reduction)
 
+        use_cache = self.config.keep_tmp and self.config.intermediate_dir
+        # Sets aligned by _validate_headers share one headers list; hash it once
+        digests: dict[int, str] = {}
         for emb_set in embedding_sets:
+            headers_key = ""
+            if use_cache:
+                headers_key = digests.get(id(emb_set.headers), "")
+                if not headers_key:
+                    headers_key = headers_digest(emb_set.headers)
+                    digests[id(emb_set.headers)] = headers_key
             if emb_set.precomputed:
                 cached = self._load_cached_projection(
-                    emb_set.name, MDS_NAME, 2, global_params
+                    emb_set.name, MDS_NAME, 2, global_params, headers_key=headers_key
                 )
                 if cached:
                     add(cached)
                     cached_projections.append(f"MDS 2 ({emb_set.name})")
                     continue
-                logger.info(f"Applying MDS 2 to '{emb_set.name}' (precomputed)")
+                logger.info("Applying MDS 2 to '%s' (precomputed)", emb_set.name)
                 effective_params = {**global_params, "precomputed": True}
                 reduction = _run_with_overridden_config(
                     self.base, effective_params, MDS_NAME, 2, emb_set.data
@@ -651,18 +914,18 @@ class ReductionPipeline:
                 reduction["name"] = format_projection_name(emb_set.name, MDS_NAME, 2)
                 add(reduction)
                 self._save_projection_cache(
-                    emb_set.name, MDS_NAME, 2, reduction, global_params
+                    emb_set.name, MDS_NAME, 2, reduction, global_params, headers_key
                 )
                 computed_count += 1
                 continue
 
+            # Resolve cache hits first, then dispatch every remaining spec as one
+            # batch. Slots keep the projections in the order the methods were given.
+            slots: list[dict[str, Any] | None] = []
+            pending: list[tuple[int, MethodSpec, dict[str, Any], str]] = []
             for spec in self.config.methods:
                 method, dims = spec.method, spec.dims
 
-                if method not in self.base.reducers:
-                    logger.warning(f"Unknown method: {method}. Skipping.")
-                    continue
-
                 # Merge global defaults with per-method overrides
                 effective_params = {**global_params, **spec.overrides_dict}
 
@@ -670,28 +933,47 @@ class ReductionPipeline:
                 param_suffix = disambiguation_suffix(spec, method_counts)
 
                 cached = self._load_cached_projection(
-                    emb_set.name, method, dims, effective_params, param_suffix
+                    emb_set.name,
+                    method,
+                    dims,
+                    effective_params,
+                    param_suffix,
+                    headers_key,
                 )
                 if cached:
-                    add(cached)
                     cached_projections.append(
                         f"{method.upper()} {dims} ({emb_set.name})"
                     )
-                    continue
-
-                logger.info(f"Applying {method.upper()} {dims} to '{emb_set.name}'")
-                reduction = _run_with_overridden_config(
-                    self.base, effective_params, method, dims, emb_set.data
-                )
-
+                else:
+                    pending.append((len(slots), spec, effective_params, param_suffix))
+                slots.append(cached)
+
+            computed = _run_reduction_batch(
+                self.base,
+                emb_set.data,
+                [(spec.method, spec.dims, params) for _, spec, params, _ in pending],
+                label=emb_set.name,
+                max_workers=self.config.max_workers,
+            )
+            for (slot, spec, effective_params, param_suffix), reduction in zip(
+                pending, computed, strict=True
+            ):
                 reduction["name"] = format_projection_name(
-                    emb_set.name, method, dims, param_suffix
+                    emb_set.name, spec.method, spec.dims, param_suffix
                 )
-                add(reduction)
                 self._save_projection_cache(
-                    emb_set.name, method, dims, reduction, effective_params
+                    emb_set.name,
+                    spec.method,
+                    spec.dims,
+                    reduction,
+                    effective_params,
+                    headers_key,
                 )
-                computed_count += 1
+                slots[slot] = reduction
+            computed_count += len(computed)
+
+            for reduction in slots:
+                add(reduction)
 
         if cached_projections:
             logger.warning(
@@ -101,11 +101,18 @@ def kmeans_elbow(
     # other heavy metrics honour). Everything below runs on Xc (canonical order);
     # labels are mapped back to the caller's order at the end.
     if ids is not None and len(ids) == n:
-        canonical = np.argsort(np.asarray(ids), kind="stable")
+        ids_arr = np.asarray(ids)
+        canonical = np.argsort(ids_arr, kind="stable")
         inverse = np.empty(n, dtype=int)
         inverse[canonical] = np.arange(n)
         Xc = X[canonical]
-        fit_rng = np.random.default_rng(id_seed(rng_seed, list(ids)))
+        if ids_arr.dtype.kind == "U":
+            # argsort order equals id_seed's str sort only for str ids
+            # (numeric ids sort 9 < 10, their strings "10" < "9")
+            seed = id_seed(rng_seed, ids_arr[canonical].tolist(), assume_sorted=True)
+        else:
+            seed = id_seed(rng_seed, list(ids))
+        fit_rng = np.random.default_rng(seed)
     else:
         canonical = inverse = None
         Xc = X
@@ -142,7 +142,9 @@ class AnnotationValidityStatistic:
             # 570k scale we materialise ~threshold float64 rows, not all of them
             # (label integers are arbitrary, so renumbering post-subsample is
             # metric-invariant). Shared across all three metrics.
-            rng = np.random.default_rng(id_seed(ctx.rng_seed, [p[0] for p in present]))
+            rng = np.random.default_rng(
+                id_seed(ctx.rng_seed, [p[0] for p in present], assume_sorted=True)
+            )
             sub = sorted_subsample(len(present), threshold, rng)
             if sub is not None:
                 present = [present[i] for i in sub]
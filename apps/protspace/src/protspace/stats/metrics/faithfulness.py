@@ -260,7 +260,7 @@ class FaithfulnessStatistic:
         sampled = False
         # Rows are already in canonical id order, so a positional draw is itself
         # id-canonical and thus row-order invariant.
-        rng = np.random.default_rng(id_seed(ctx.rng_seed, ids))
+        rng = np.random.default_rng(id_seed(ctx.rng_seed, ids, assume_sorted=True))
         idx = sorted_subsample(n, sample_threshold, rng)
         if idx is not None:
             emb = emb[idx]
@@ -0,0 +1,30 @@
+"""Atomic file writes shared by bundles and on-disk caches."""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` atomically (temp file + ``os.replace``).
+
+    The destination is never left truncated or partial on interrupt: it keeps
+    the old bytes until the rename completes, then atomically becomes the full
+    new bytes. A Ctrl+C can no longer destroy a bundle overwritten in place
+    (``transfer -b x -o x``) or leave a cache that fails to parse.
+
+    The temp file comes from ``mkstemp`` in the same directory, so concurrent
+    writers of one path never share a temp file or delete each other's; the
+    last rename wins with a complete file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,29 @@
+"""Tests for the ``protspace annotate`` command."""
+
+from typer.testing import CliRunner
+
+from protspace.cli.app import app
+
+
+def test_annotation_file_is_rejected_before_reading_input(tmp_path):
+    fasta = tmp_path / "in.fasta"
+    fasta.write_text(">P12345\nMKV\n")
+
+    result = CliRunner().invoke(
+        app, ["annotate", "-i", str(fasta), "-a", "ec,META.CSV"]
+    )
+
+    assert result.exit_code != 0
+    assert "META.CSV" in result.output
+    assert not (tmp_path / "annotations.parquet").exists()
+
+
+def test_unknown_annotation_is_rejected_before_reading_input(tmp_path):
+    # Input is not a valid FASTA/HDF5: reaching it would be a different error
+    bogus = tmp_path / "in.txt"
+    bogus.write_text("")
+
+    result = CliRunner().invoke(app, ["annotate", "-i", str(bogus), "-a", "ecc"])
+
+    assert result.exit_code != 0
+    assert "Unknown annotation 'ecc'" in result.output
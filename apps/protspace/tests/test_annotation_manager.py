@@ -141,6 +141,16 @@ class TestProteinAnnotationExtractorInit:
         assert extractor.config.taxonomy_annotations is None
         assert extractor.config.interpro_annotations is None
 
+    def test_taxon_counts_group_by_organism(self):
+        """Counts merge str/int forms of one organism and skip bad ids."""
+        ids = ["9606", 9606, "9606", "10090", "", None, "n/a"]
+        proteins = [
+            ProteinAnnotations(f"P{i}", {"organism_id": org})
+            for i, org in enumerate(ids)
+        ]
+        counts = ProteinAnnotationManager._get_taxon_counts(proteins)
+        assert counts == {9606: 3, 10090: 1}
+
 
 class TestAnnotationConfiguration:
     """Test the AnnotationConfiguration module."""
@@ -180,6 +190,54 @@ class TestAnnotationConfiguration:
         ):
             AnnotationConfiguration(user_annotations=invalid_annotations)
 
+    def test_validate_reports_all_invalid_annotations(self):
+        """Test that every unknown annotation is named in a single error."""
+        with pytest.raises(
+            ValueError,
+            match="Unknown annotations 'bogus_one', 'bogus_two'",
+        ):
+            AnnotationConfiguration(
+                user_annotations=["bogus_one", "genus", "bogus_two"]
+            )
+
+    def test_validate_deduplicates_in_first_seen_order(self):
+        """Repeats and always-included names appear once, in first-seen order."""
+        config = AnnotationConfiguration(
+            user_annotations=["gene_name", "ec", "genus", "ec"]
+        )
+        assert config.user_annotations == [
+            "gene_name",
+            "ec",
+            "genus",
+            "protein_name",
+            "uniprot_kb_id",
+        ]
+
+    def test_add_required_annotations_puts_needed_first(self):
+        """accession/organism_id lead exactly once; sequence is added once."""
+        result = AnnotationConfiguration._add_required_annotations(
+            ["ec", "organism_id", "sequence", "accession"], needs_sequence=True
+        )
+        assert result == ["accession", "organism_id", "ec", "sequence"]
+
+    def test_repeated_selection_is_resolved_once(self):
+        """Identical requests reuse the memoised resolution."""
+        AnnotationConfiguration._resolve.cache_clear()
+        AnnotationConfiguration(user_annotations=["ec", "genus"])
+        AnnotationConfiguration(user_annotations=["ec", "genus"])
+        AnnotationConfiguration(user_annotations=["genus", "ec"])
+        info = AnnotationConfiguration._resolve.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    def test_instances_do_not_share_lists(self):
+        """Mutating one configuration must not leak into the next."""
+        first = AnnotationConfiguration(user_annotations=["pfam"])
+        first.interpro_annotations.append("cath")
+        first.user_annotations.clear()
+        second = AnnotationConfiguration(user_annotations=["pfam"])
+        assert second.interpro_annotations == ["pfam"]
+        assert "pfam" in second.user_annotations
+
     def test_validate_with_length(self):
         """Test validation includes length annotation."""
         annotations = ["length", "genus"]
@@ -234,6 +292,66 @@ class TestAnnotationConfiguration:
         assert config.taxonomy_annotations is None
         assert config.interpro_annotations is None
 
+    def test_categorize_annotations_by_source(self):
+        """Every source gets a bucket; non-annotation columns are ignored."""
+        by_source = AnnotationConfiguration.categorize_annotations_by_source(
+            frozenset({"ec", "genus", "pfam", "identifier"})
+        )
+        assert by_source == {
+            "uniprot": {"ec"},
+            "taxonomy": {"genus"},
+            "interpro": {"pfam"},
+            "ted": set(),
+            "biocentral": set(),
+        }
+
+    def test_determine_sources_to_fetch(self):
+        """Only sources with missing annotations are fetched, plus dependencies."""
+        needed = AnnotationConfiguration.determine_sources_to_fetch(
+            cached_annotations={"length", "accession"},
+            required_annotations={"length", "genus", "pfam"},
+        )
+        assert needed == {
+            "uniprot": True,  # organism_id and sequence are not cached
+            "taxonomy": True,
+            "interpro": True,
+            "ted": False,
+            "biocentral": False,
+        }
+
+        needed = AnnotationConfiguration.determine_sources_to_fetch(
+            cached_annotations={"genus", "organism_id"},
+            required_annotations={"genus"},
+        )
+        assert not any(needed.values())
+
+    def test_fully_cached_request_skips_planning(self):
+        """A request covered by the cache fetches nothing, without the memo."""
+        AnnotationConfiguration._sources_to_fetch.cache_clear()
+        needed = AnnotationConfiguration.determine_sources_to_fetch(
+            cached_annotations={"genus", "pfam", "length"},
+            required_annotations={"genus", "pfam"},
+        )
+        assert needed == dict.fromkeys(
+            ("uniprot", "taxonomy", "interpro", "ted", "biocentral"), False
+        )
+        assert AnnotationConfiguration._sources_to_fetch.cache_info().misses == 0
+
+    def test_determine_sources_to_fetch_is_memoised(self):
+        """Repeated plans hit the cache and callers get their own dict."""
+        AnnotationConfiguration._sources_to_fetch.cache_clear()
+        first = AnnotationConfiguration.determine_sources_to_fetch(
+            {"length"}, {"length", "pfam"}
+        )
+        first["ted"] = True
+        second = AnnotationConfiguration.determine_sources_to_fetch(
+            {"length"}, {"pfam", "length"}
+        )
+        info = AnnotationConfiguration._sources_to_fetch.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert second["ted"] is False
+        assert second["interpro"] and second["uniprot"]
+
 
 class TestAnnotationMerger:
     """Test the AnnotationMerger module."""
@@ -316,6 +434,44 @@ class TestAnnotationMerger:
         assert result[0].annotations.get("genus") == "Homo"
         assert "genus" not in result[1].annotations  # No taxonomy data available
 
+    def test_merge_resolves_mixed_organism_id_forms(self):
+        """int and str organism ids resolve as int(); bad ids are skipped."""
+        taxonomy_annotations = {9606: {"annotations": {"genus": "Homo"}}}
+        ids = [9606, "9606", " 9606", "", None, "n/a", "10090"]
+        proteins = [
+            ProteinAnnotations(f"P{i}", {"organism_id": org})
+            for i, org in enumerate(ids)
+        ]
+        result = AnnotationMerger().merge(proteins, taxonomy_annotations)
+        assert [p.annotations.get("genus") for p in result] == [
+            "Homo",
+            "Homo",
+            "Homo",
+            None,
+            None,
+            None,
+            None,
+        ]
+
+    def test_config_and_merger_are_slotted(self):
+        """Neither class carries a per-instance __dict__."""
+        assert not hasattr(AnnotationConfiguration(["ec"]), "__dict__")
+        assert not hasattr(AnnotationMerger(), "__dict__")
+
+    def test_merge_copy_flag(self):
+        """By default inputs are untouched; copy=False merges in place."""
+        taxonomy_annotations = {9606: {"annotations": {"genus": "Homo"}}}
+
+        protein = ProteinAnnotations("P1", {"organism_id": "9606"})
+        [merged] = AnnotationMerger().merge([protein], taxonomy_annotations)
+        assert merged.annotations["genus"] == "Homo"
+        assert "genus" not in protein.annotations
+
+        protein = ProteinAnnotations("P1", {"organism_id": "9606"})
+        [merged] = AnnotationMerger(copy=False).merge([protein], taxonomy_annotations)
+        assert merged is protein
+        assert protein.annotations["genus"] == "Homo"
+
 
 class TestAnnotationWriter:
     """Test the AnnotationWriter module."""
@@ -368,6 +524,25 @@ class TestAnnotationWriter:
             assert len(df) == 2
             assert list(df["identifier"]) == ["P1", "P2"]
 
+    def test_write_parquet_bounds_row_groups(self, monkeypatch):
+        """The cache is split into row groups so readers can stream it."""
+        import pyarrow.parquet as pq
+
+        from src.protspace.data.io import writers
+
+        monkeypatch.setitem(writers.PARQUET_WRITE_OPTIONS, "row_group_size", 2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "test_output.parquet"
+            proteins = [
+                ProteinAnnotations(identifier=f"P{i}", annotations={"genus": "Homo"})
+                for i in range(5)
+            ]
+            writers.AnnotationWriter().write_parquet(proteins, output_path)
+
+            metadata = pq.ParquetFile(output_path).metadata
+            assert metadata.num_row_groups == 3
+            assert metadata.row_group(0).column(0).compression == "ZSTD"
+
 
 class TestDataFormatter:
     """Test the DataFormatter module."""
@@ -618,7 +793,7 @@ class TestExpandAnnotationGroups:
     def test_group_expansion_uniprot(self):
         """Test that 'uniprot' expands to all user-facing UniProt annotations."""
         result = expand_annotation_groups(["uniprot"])
-        assert result == ANNOTATION_GROUPS["uniprot"]
+        assert result == list(ANNOTATION_GROUPS["uniprot"])
 
     def test_group_expansion_interpro(self):
         """Test that 'interpro' expands to all InterPro annotations."""
@@ -633,14 +808,14 @@ class TestExpandAnnotationGroups:
     def test_group_expansion_default(self):
         """Test that 'default' expands to the curated subset."""
         result = expand_annotation_groups(["default"])
-        assert result == ANNOTATION_GROUPS["default"]
+        assert result == list(ANNOTATION_GROUPS["default"])
         assert "reviewed" in result
         assert "protein_families" in result
 
     def test_group_expansion_all(self):
         """Test that 'all' expands to all annotations from all sources."""
         result = expand_annotation_groups(["all"])
-        assert result == ANNOTATION_GROUPS["all"]
+        assert result == list(ANNOTATION_GROUPS["all"])
         # Should contain annotations from all three sources
         assert "reviewed" in result  # UniProt
         assert "kingdom" in result  # Taxonomy
@@ -737,15 +912,47 @@ class TestConstants:
         ]:
             assert all(a in ALL_ANNOTATIONS for a in source)
 
+    def test_configuration_imports_without_retrievers(self):
+        """Validating names must not pay for requests/tqdm and the retrievers."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import protspace.data.annotations.configuration\n"
+            "heavy = ('requests', 'tqdm', 'protspace.data.annotations.retrievers')\n"
+            "print([m for m in heavy if m in sys.modules])\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == "[]"
+
     def test_needed_uniprot_annotations_constant(self):
         """Test NEEDED_UNIPROT_ANNOTATIONS constant."""
-        assert NEEDED_UNIPROT_ANNOTATIONS == ["accession", "organism_id"]
+        assert NEEDED_UNIPROT_ANNOTATIONS == ("accession", "organism_id")
 
     def test_length_in_user_annotations(self):
         """Test that length is a user-facing annotation."""
         assert "length" in ANNOTATION_GROUPS["default"]
         assert "length" in ANNOTATION_GROUPS["uniprot"]
 
+    def test_protein_annotations_is_one_shared_type(self):
+        """Retrievers, merger, transformer and writers share one slotted type."""
+        from src.protspace.data.annotations import merging
+        from src.protspace.data.annotations.retrievers import interpro_retriever
+        from src.protspace.data.annotations.transformers import transformer
+        from src.protspace.data.io import formatters, writers
+
+        for module in (merging, interpro_retriever, transformer, formatters, writers):
+            assert module.ProteinAnnotations is ProteinAnnotations
+        protein = ProteinAnnotations("P1", {"length": "10"})
+        assert not hasattr(protein, "__dict__")
+        assert protein == ProteinAnnotations(
+            identifier="P1", annotations={"length": "10"}
+        )
+
 
 # --- Mock UniProt JSON data with evidence ---
 
@@ -1208,3 +1415,31 @@ class TestStripScores:
         assert result["go_bp"].iloc[0] == "apoptotic process;signal transduction"
         assert result["go_mf"].iloc[0] == "kinase activity;ATP binding"
         assert result["go_cc"].iloc[0] == "cytoplasm;nucleus"
+
+    def test_vectorised_strip_matches_split_reference(self):
+        """Both regex paths (string and mixed columns) match the split-based strip."""
+        from src.protspace.data.annotations.scores import strip_scores_from_df
+
+        def reference(value):
+            # The original per-cell algorithm, kept independent of scores.py
+            if pd.isna(value) or value == "":
+                return value
+            return ";".join(part.split("|")[0] for part in str(value).split(";"))
+
+        values = ["a|b|c;d", "x;y|1;|2", "", None, "plain"]
+        df = pd.DataFrame({"ec": values, "pfam": [1.5, "PF1|2", None, "", 7]})
+        result = strip_scores_from_df(df)
+        for col in ("ec", "pfam"):
+            expected = df[col].apply(reference)
+            pd.testing.assert_series_equal(result[col], expected, check_dtype=False)
+        assert result["ec"].tolist()[:2] == ["a;d", "x;y;"]
+        assert result["pfam"].tolist()[:2] == ["1.5", "PF1"]
+
+    def test_strip_scores_from_cell(self):
+        """Each ';' entry keeps only its text before the first '|'."""
+        from src.protspace.data.annotations.scores import _strip_scores_from_cell
+
+        assert _strip_scores_from_cell("a|b|c;d") == "a;d"
+        assert _strip_scores_from_cell("x;y|1;|2") == "x;y;"
+        assert _strip_scores_from_cell(1.5) == "1.5"
+        assert _strip_scores_from_cell("") == ""
@@ -0,0 +1,47 @@
+"""Tests for atomic file writes."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.protspace.utils.atomic import atomic_write_bytes
+
+
+def test_replaces_content_without_leftovers(tmp_path):
+    f = tmp_path / "cache.json"
+    f.write_text('{"old": 1}')
+
+    atomic_write_bytes(f, b'{"new": 2}')
+
+    assert f.read_text() == '{"new": 2}'
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_failed_write_keeps_old_content(tmp_path):
+    f = tmp_path / "cache.json"
+    f.write_text('{"old": 1}')
+
+    with (
+        patch("os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        atomic_write_bytes(f, b'{"new": 2}')
+
+    assert f.read_text() == '{"old": 1}'
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_concurrent_writers_leave_one_complete_file(tmp_path):
+    f = tmp_path / "cache.json"
+    payloads = [bytes([65 + i]) * 200_000 for i in range(8)]
+    threads = [
+        threading.Thread(target=atomic_write_bytes, args=(f, data)) for data in payloads
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert f.read_bytes() in payloads
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
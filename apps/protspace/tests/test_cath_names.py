@@ -1,6 +1,9 @@
 """Tests for CATH names file parsing."""
 
+from unittest.mock import Mock
+
 from src.protspace.data.annotations.retrievers.cath_names import _parse_cath_names
+from src.protspace.utils.atomic import atomic_write_bytes
 
 
 class TestParseCathNames:
@@ -62,3 +65,48 @@ class TestParseCathNames:
         names = _parse_cath_names(f)
 
         assert names["2.60.40.10"] == "Immunoglobulins"
+
+
+class TestGetCathNamesCache:
+    """The names map is persisted before the timestamp that marks it fresh."""
+
+    CONTENT = "1                 1oaiA00    :Mainly Alpha\n"
+
+    def test_timestamp_written_after_names(self, tmp_path, monkeypatch):
+        from src.protspace.data.annotations.retrievers import cath_names
+
+        monkeypatch.setattr(cath_names, "CATH_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(
+            cath_names.requests, "get", lambda *a, **k: Mock(text=self.CONTENT)
+        )
+        written = []
+
+        def record(path, data):
+            written.append(path.name)
+            atomic_write_bytes(path, data)
+
+        monkeypatch.setattr(cath_names, "atomic_write_bytes", record)
+
+        assert cath_names.get_cath_names() == {"1": "Mainly Alpha"}
+        assert written == ["cath_names.json", "cath_names.timestamp"]
+
+    def test_crash_before_timestamp_redownloads(self, tmp_path, monkeypatch):
+        from src.protspace.data.annotations.retrievers import cath_names
+
+        monkeypatch.setattr(cath_names, "CATH_CACHE_DIR", tmp_path)
+        get = Mock(return_value=Mock(text=self.CONTENT))
+        monkeypatch.setattr(cath_names.requests, "get", get)
+
+        def fail_on_timestamp(path, data):
+            if path.suffix == ".timestamp":
+                raise OSError("killed")
+            atomic_write_bytes(path, data)
+
+        monkeypatch.setattr(cath_names, "atomic_write_bytes", fail_on_timestamp)
+        cath_names.get_cath_names()
+        monkeypatch.setattr(cath_names, "atomic_write_bytes", atomic_write_bytes)
+        cath_names.get_cath_names()
+
+        # No timestamp, so the fresh map is not trusted: fetched again
+        assert get.call_count == 2
+        assert (tmp_path / "cath_names.timestamp").exists()
@@ -0,0 +1,33 @@
+"""Tests for protspace.core.constants."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from protspace.core.constants import standardize_missing
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series(["a", "", None, "nan", "NA", np.nan, "None"], dtype=object),
+        pd.Series([1.0, np.nan, 3.0]),
+        pd.Series(["a", "", "b", None], dtype="category"),
+        pd.Series([None, None], dtype="category"),
+    ],
+    ids=["object", "float", "categorical", "all-missing-categorical"],
+)
+def test_standardize_missing_matches_astype_replace(series):
+    expected = (
+        series.astype(str)
+        .replace(dict.fromkeys(("", "nan", "none", "null", "NA", "NaN"), "<N/A>"))
+        .fillna("<N/A>")
+    )
+    result = standardize_missing(series)
+    assert result.tolist() == expected.tolist()
+    assert result.index.equals(series.index)
+
+
+def test_standardize_missing_keeps_values_that_only_look_missing():
+    result = standardize_missing(pd.Series(["None", "n/a", "<N/A>"]))
+    assert result.tolist() == ["None", "n/a", "<N/A>"]
@@ -1,5 +1,7 @@
 """Tests for FASTA parsing utilities."""
 
+import gzip
+import os
 import tempfile
 from pathlib import Path
 
@@ -104,3 +106,95 @@ class TestIsFastaFile:
     def test_fasta_extensions_constant(self):
         """Verify the FASTA_EXTENSIONS set."""
         assert FASTA_EXTENSIONS == {".fasta", ".fa", ".faa"}
+
+
+class TestQueryCache:
+    """Test the user-level UniProt query cache."""
+
+    FASTA = ">sp|P01308|INS_HUMAN Insulin\nMALW\n>sp|P01315|INS_PIG Insulin\nMALW\n"
+
+    @pytest.fixture(autouse=True)
+    def _cache_dir(self, tmp_path, monkeypatch):
+        from src.protspace.data.loaders import query
+
+        monkeypatch.setattr(query, "QUERY_CACHE_DIR", tmp_path / "queries")
+        self.query = query
+
+    def test_hit_skips_download(self, tmp_path, monkeypatch):
+        self.query.QUERY_CACHE_DIR.mkdir()
+        self.query._query_cache_path("organism_id:9606").write_text(self.FASTA)
+
+        def no_network(*args, **kwargs):
+            raise AssertionError("should not download")
+
+        monkeypatch.setattr(self.query.requests, "get", no_network)
+        save_to = tmp_path / "out" / "sequences.fasta"
+        ids, path = self.query.query_uniprot("organism_id:9606", save_to=save_to)
+
+        assert ids == ["P01308", "P01315"]
+        assert path == save_to
+        assert save_to.read_text() == self.FASTA
+
+    def test_other_query_or_stale_entry_misses(self):
+        self.query.QUERY_CACHE_DIR.mkdir()
+        cached = self.query._query_cache_path("q")
+        cached.write_text(self.FASTA)
+
+        assert self.query._load_cached_query("q", None) is not None
+        assert self.query._load_cached_query("other", None) is None
+
+        old = cached.stat().st_mtime - 25 * 3600
+        os.utime(cached, (old, old))
+        assert self.query._load_cached_query("q", None) is None
+
+    def test_failed_store_keeps_previous_entry(self, tmp_path, monkeypatch):
+        self.query.QUERY_CACHE_DIR.mkdir()
+        cached = self.query._query_cache_path("q")
+        cached.write_text(self.FASTA)
+        fresh = tmp_path / "fresh.fasta"
+        fresh.write_text(self.FASTA + ">sp|P99999|X\nM\n")
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(self.query.os, "replace", fail)
+        self.query._store_cached_query("q", fresh)
+
+        assert cached.read_text() == self.FASTA
+        assert list(self.query.QUERY_CACHE_DIR.iterdir()) == [cached]
+
+    def test_store_prunes_expired_entries(self, tmp_path):
+        self.query.QUERY_CACHE_DIR.mkdir()
+        stale = self.query._query_cache_path("old")
+        stale.write_text(self.FASTA)
+        old = stale.stat().st_mtime - 25 * 3600
+        os.utime(stale, (old, old))
+        fresh = tmp_path / "fresh.fasta"
+        fresh.write_text(self.FASTA)
+
+        self.query._store_cached_query("new", fresh)
+
+        assert list(self.query.QUERY_CACHE_DIR.iterdir()) == [
+            self.query._query_cache_path("new")
+        ]
+        assert self.query._query_cache_path("new").read_text() == self.FASTA
+
+    def test_download_extracts_fasta_and_ids_in_one_pass(self, tmp_path, monkeypatch):
+        payload = gzip.compress(self.FASTA.encode())
+
+        class Response:
+            headers = {"content-length": str(len(payload))}
+
+            def raise_for_status(self):
+                pass
+
+            def iter_content(self, chunk_size):
+                yield payload
+
+        monkeypatch.setattr(self.query.requests, "get", lambda *a, **k: Response())
+        save_to = tmp_path / "out" / "sequences.fasta"
+        ids, path = self.query.query_uniprot("q", save_to=save_to, use_cache=False)
+
+        assert ids == ["P01308", "P01315"]
+        assert path == save_to
+        assert save_to.read_text() == self.FASTA
@@ -1,9 +1,10 @@
+import io
 import json
 import os
 import tempfile
 import time
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import requests
 
@@ -133,18 +134,18 @@ class TestInterProAnnotationRetrieverInit:
 
     def test_manage_headers_other(self):
         """Test header management for other header formats."""
-        headers = ["generic|PROTEIN1|extra", "simple_header"]
+        headers = ["generic|PROTEIN1|extra", "simple_header", "SP|P1", "a||b"]
 
         retriever = InterProAnnotationRetriever()
         managed = retriever._manage_headers(headers)
 
-        assert managed == ["PROTEIN1", "simple_header"]
+        assert managed == ["PROTEIN1", "simple_header", "P1", ""]
 
 
 class TestInterProAnnotationRetrieverFetch:
     """Test InterProAnnotationRetriever fetch_annotations method."""
 
-    @patch("src.protspace.data.annotations.retrievers.interpro_retriever.requests.post")
+    @patch.object(requests.Session, "post")
     def test_fetch_annotations_success(self, mock_post):
         """Test successful annotation fetching."""
         headers = [TEST_PROTEIN_ID]
@@ -179,6 +180,112 @@ class TestInterProAnnotationRetrieverFetch:
         assert result[0].annotations["pfam"] == "PF00001 (7tm_1)|50.2"
         assert "pfam_score" not in result[0].annotations
 
+    @patch.object(requests.Session, "post")
+    def test_batches_run_concurrently_and_keep_order(self, mock_post):
+        """Later batches may finish first; results still follow batch order."""
+        import threading
+        import time
+
+        from src.protspace.data.annotations.retrievers.interpro_retriever import (
+            CHUNK_SIZE,
+        )
+
+        in_flight = []
+        lock = threading.Lock()
+        active = 0
+
+        def post(url, json, **kwargs):
+            nonlocal active
+            with lock:
+                active += 1
+                in_flight.append(active)
+            first = json["md5"][0]
+            time.sleep(0.05 if first == "0" else 0.01)
+            with lock:
+                active -= 1
+            response = Mock()
+            if first == str(2 * CHUNK_SIZE):
+                response.status_code = 500
+                return response
+            response.status_code = 200
+            response.json.return_value = {"results": [{"md5": first}]}
+            return response
+
+        mock_post.side_effect = post
+        md5s = [str(i) for i in range(4 * CHUNK_SIZE)]
+        results = list(InterProAnnotationRetriever()._get_matches_in_batches(md5s))
+
+        assert [r["md5"] for r in results] == [
+            "0",
+            str(CHUNK_SIZE),
+            str(3 * CHUNK_SIZE),
+        ]
+        assert max(in_flight) > 1
+
+    @patch.object(requests.Session, "post")
+    def test_bad_json_batch_is_skipped(self, mock_post):
+        """A 200 with an unparsable body drops that batch only."""
+        from src.protspace.data.annotations.retrievers.interpro_retriever import (
+            CHUNK_SIZE,
+        )
+
+        def post(url, json, **kwargs):
+            first = json["md5"][0]
+            response = Mock(status_code=200)
+            if first == str(CHUNK_SIZE):
+                response.json.side_effect = requests.exceptions.JSONDecodeError(
+                    "Expecting value", "<html>", 0
+                )
+            else:
+                response.json.return_value = {"results": [{"md5": first}]}
+            return response
+
+        mock_post.side_effect = post
+        md5s = [str(i) for i in range(3 * CHUNK_SIZE)]
+        results = list(InterProAnnotationRetriever()._get_matches_in_batches(md5s))
+
+        assert [r["md5"] for r in results] == ["0", str(2 * CHUNK_SIZE)]
+
+    def test_batches_share_one_retrying_session(self):
+        """Batches reuse a pooled session that retries transient errors on POST."""
+        retriever = InterProAnnotationRetriever()
+        retry = retriever._session.get_adapter("https://www.ebi.ac.uk").max_retries
+        assert retry.total == 3
+        assert 503 in retry.status_forcelist
+        assert retry.is_retry("POST", 503)
+        assert not retry.is_retry("POST", 404)
+
+    def test_identical_sequences_are_queried_once(self):
+        """Identifiers sharing a sequence are hashed/sent once, annotated alike."""
+        import hashlib
+
+        md5 = hashlib.md5(TEST_SEQUENCE.encode()).hexdigest().upper()
+        match = create_signature("PF00001", name="7tm_1", score=50.2)
+        retriever = InterProAnnotationRetriever(
+            headers=[TEST_PROTEIN_ID, TEST_PROTEIN_ID_2, "P99999"],
+            annotations=["pfam"],
+            sequences={
+                TEST_PROTEIN_ID: TEST_SEQUENCE,
+                TEST_PROTEIN_ID_2: TEST_SEQUENCE,
+                "P99999": TEST_SEQUENCE_2,
+            },
+        )
+        with patch.object(
+            retriever,
+            "_get_matches_in_batches",
+            return_value=[create_api_result(md5, matches=[match])],
+        ) as mock_get:
+            result = retriever.fetch_annotations()
+
+        assert len(mock_get.call_args.args[0]) == 2
+        by_id = {p.identifier: p.annotations["pfam"] for p in result}
+        assert by_id == {
+            TEST_PROTEIN_ID: "PF00001 (7tm_1)|50.2",
+            TEST_PROTEIN_ID_2: "PF00001 (7tm_1)|50.2",
+            "P99999": "",
+        }
+        assert result[0].annotations is not result[1].annotations
+
     def test_fetch_annotations_no_headers(self):
         """Test fetch_annotations with no headers."""
         retriever = InterProAnnotationRetriever(
@@ -868,7 +975,7 @@ class TestMemberDbNameMapCaching:
 
             assert result == expected
 
-    @patch("src.protspace.data.annotations.retrievers.interpro_retriever.requests.get")
+    @patch.object(requests.Session, "get")
     def test_cache_miss_triggers_download(self, mock_get):
         """Test that missing cache triggers download and parse."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -887,10 +994,9 @@ class TestMemberDbNameMapCaching:
 
             gz_data = _gzip.compress(xml_content)
 
-            mock_resp = Mock()
-            mock_resp.status_code = 200
-            mock_resp.raise_for_status = Mock()
-            mock_resp.iter_content = Mock(return_value=[gz_data])
+            mock_resp = MagicMock()
+            mock_resp.__enter__.return_value = mock_resp
+            mock_resp.raw = io.BytesIO(gz_data)
             mock_get.return_value = mock_resp
 
             with patch(
@@ -901,11 +1007,13 @@ class TestMemberDbNameMapCaching:
 
             assert "SSF" in result
             assert result["SSF"]["SSF53098"] == "Test domain"
-            # Cache files should be created
-            assert (cache_dir / "member_db_names.json").exists()
-            assert (cache_dir / "member_db_names.timestamp").exists()
+            # Parsed straight from the stream: only the cache files are written
+            assert sorted(p.name for p in cache_dir.iterdir()) == [
+                "member_db_names.json",
+                "member_db_names.timestamp",
+            ]
 
-    @patch("src.protspace.data.annotations.retrievers.interpro_retriever.requests.get")
+    @patch.object(requests.Session, "get")
     def test_download_failure_returns_empty(self, mock_get):
         """Test that download failure returns empty map when no cache exists."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -921,7 +1029,7 @@ class TestMemberDbNameMapCaching:
 
             assert result == {}
 
-    @patch("src.protspace.data.annotations.retrievers.interpro_retriever.requests.get")
+    @patch.object(requests.Session, "get")
     def test_download_failure_falls_back_to_stale_cache(self, mock_get):
         """Test that download failure falls back to stale cache if available."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -997,6 +1105,25 @@ class TestXmlParsing:
         # PFAM should not appear
         assert "PFAM" not in result
 
+    def test_parse_blank_or_missing_xref_attributes(self):
+        """Blank/missing names fall back to the entry name; no dbkey, no row."""
+        xml = b"""\
+<?xml version="1.0"?>
+<interprodb>
+  <interpro id="IPR000001" type="Domain">
+    <name>Kringle</name>
+    <db_xref db="SSF" dbkey="SSF57440" name="  "/>
+    <db_xref db="SSF" dbkey="SSF57441"/>
+    <db_xref db="SSF" name="Orphan"/>
+    <db_xref dbkey="X1" name="No db"/>
+  </interpro>
+</interprodb>"""
+        with tempfile.TemporaryDirectory() as tmp:
+            gz_path = self._create_gz_xml(xml, tmp)
+            result = InterProRetriever._parse_interpro_xml(gz_path)
+
+        assert result["SSF"] == {"SSF57440": "Kringle", "SSF57441": "Kringle"}
+
     def test_parse_empty_xml(self):
         """Test parsing an XML with no interpro elements."""
         xml = b"""\
@@ -3,6 +3,7 @@
 from collections import Counter
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from protspace.data.loaders.embedding_set import (
@@ -15,8 +16,11 @@ from protspace.data.processors.pipeline import (
     MethodSpec,
     PipelineConfig,
     ReductionPipeline,
+    _run_reduction_batch,
     _run_with_overridden_config,
     disambiguation_suffix,
+    drop_unknown_methods,
+    headers_digest,
     parse_method_spec,
     parse_methods_arg,
 )
@@ -62,6 +66,13 @@ class TestParseMethodSpec:
         with pytest.raises(ValueError):
             parse_method_spec("pca")
 
+    def test_method_name_is_case_insensitive(self):
+        assert parse_method_spec("UMAP2") == parse_method_spec("umap2")
+
+    def test_invalid_interleaved(self):
+        with pytest.raises(ValueError, match="Invalid method spec"):
+            parse_method_spec("p2ca")
+
 
 # ---------------------------------------------------------------------------
 # parse_method_spec with overrides
@@ -186,6 +197,25 @@ class TestParseMethodsArg:
         assert len(result) == 2
 
 
+class TestDropUnknownMethods:
+    def test_known_methods_pass_through(self):
+        specs = parse_methods_arg(["pca2,umap2"])
+        assert drop_unknown_methods(specs) == specs
+
+    def test_unknown_methods_dropped_with_single_warning(self, caplog):
+        specs = parse_methods_arg(["pca2,foo2,umap3,bar3,foo3"])
+        with caplog.at_level("WARNING"):
+            kept = drop_unknown_methods(specs)
+        assert [str(s) for s in kept] == ["pca2", "umap3"]
+        warnings = [r for r in caplog.records if "Unknown method" in r.message]
+        assert len(warnings) == 1
+        assert "bar, foo" in warnings[0].message
+
+    def test_custom_known_set(self):
+        specs = parse_methods_arg(["pca2,umap2"])
+        assert [s.method for s in drop_unknown_methods(specs, {"umap"})] == ["umap"]
+
+
 # ---------------------------------------------------------------------------
 # format_projection_name
 # ---------------------------------------------------------------------------
@@ -344,6 +374,9 @@ class TestResolveAnnotationNames:
     def test_tsv_path(self):
         assert self._resolve(["data.tsv", "ec"]) == (["ec"], "data.tsv")
 
+    def test_uppercase_suffix(self):
+        assert self._resolve(["META.CSV", "ec"]) == (["ec"], "META.CSV")
+
 
 # ---------------------------------------------------------------------------
 # _validate_headers
@@ -375,6 +408,15 @@ class TestValidateHeaders:
         result = pipeline._validate_headers([es1, es2])
         assert result == ["A", "B", "C"]
 
+    def test_sets_share_one_headers_list(self):
+        # Lets _run_reductions hash the headers once for the projection cache
+        pipeline = self._make_pipeline()
+        es1 = self._make_es("m1", ["A", "B", "C"])
+        es2 = self._make_es("m2", ["A", "B", "C"])
+        result = pipeline._validate_headers([es1, es2])
+        assert es1.headers is result
+        assert es2.headers is result
+
     def test_intersection(self):
         pipeline = self._make_pipeline()
         es1 = self._make_es("m1", ["A", "B", "C"])
@@ -401,6 +443,114 @@ class TestValidateHeaders:
         np.testing.assert_array_equal(es2.data[0], es2_row_a)
 
 
+# ---------------------------------------------------------------------------
+# _align_metadata
+# ---------------------------------------------------------------------------
+
+
+class TestAlignMetadata:
+    def test_reorders_dedups_and_fills_missing(self):
+        metadata = pd.DataFrame(
+            {"protein_id": ["B", "A", "B", "Z"], "score": [1, 2, 3, 4]}
+        )
+        result = ReductionPipeline._align_metadata(metadata, ["A", "B", "C"])
+        assert list(result.columns) == ["identifier", "score"]
+        assert result["identifier"].tolist() == ["A", "B", "C"]
+        assert result["score"].tolist()[:2] == ["2", "1"]
+        assert pd.isna(result["score"].iloc[2])
+
+    def test_matches_casting_every_column(self):
+        metadata = pd.DataFrame(
+            {
+                "identifier": ["A", "B"],
+                "name": ["x", "y"],
+                "mixed": ["x", None],
+                "num": [1.5, np.nan],
+            }
+        )
+        result = ReductionPipeline._align_metadata(metadata, ["A", "B"])
+        # Same values as casting every column, whatever the pandas version
+        expected = metadata.drop(columns="identifier").astype(str)
+        for col in expected.columns:
+            pd.testing.assert_series_equal(
+                result[col], expected[col], check_dtype=False
+            )
+
+    def test_already_aligned(self):
+        metadata = pd.DataFrame({"identifier": ["A", "B"], "x": [1, 2]})
+        result = ReductionPipeline._align_metadata(metadata, ["A", "B"])
+        assert result.to_dict("list") == {"identifier": ["A", "B"], "x": ["1", "2"]}
+
+    def test_identifier_only(self):
+        metadata = pd.DataFrame({"identifier": ["A"]})
+        result = ReductionPipeline._align_metadata(metadata, ["A", "B"])
+        assert result.to_dict("list") == {"identifier": ["A", "B"]}
+
+    def test_non_string_identifiers_match(self):
+        metadata = pd.DataFrame({"identifier": [1, 2], "x": ["a", "b"]})
+        result = ReductionPipeline._align_metadata(metadata, ["2", "1"])
+        assert result["x"].tolist() == ["b", "a"]
+
+
+# ---------------------------------------------------------------------------
+# headers_digest / projection cache key
+# ---------------------------------------------------------------------------
+
+
+class TestProjectionCacheKey:
+    def test_digest_is_order_sensitive(self):
+        assert headers_digest(["A", "B"]) == headers_digest(["A", "B"])
+        assert headers_digest(["A", "B"]) != headers_digest(["B", "A"])
+
+    def test_protein_set_changes_cache_path(self, tmp_path):
+        config = PipelineConfig(
+            methods=[MethodSpec("pca", 2)],
+            output_path=tmp_path,
+            keep_tmp=True,
+            intermediate_dir=tmp_path,
+        )
+        pipeline = ReductionPipeline(config)
+        path_ab = pipeline._projection_cache_path(
+            "prot_t5", "pca", 2, headers_key=headers_digest(["A", "B"])
+        )
+        path_abc = pipeline._projection_cache_path(
+            "prot_t5", "pca", 2, headers_key=headers_digest(["A", "B", "C"])
+        )
+        assert path_ab != path_abc
+
+
+class TestRefetchAnnotationSources:
+    def test_only_refetched_source_columns_are_dropped(self, tmp_path, monkeypatch):
+        from protspace.data.annotations import manager
+
+        pd.DataFrame(
+            {"identifier": ["A"], "ec": ["1.1"], "genus": ["Homo"], "pfam": ["PF1"]}
+        ).to_parquet(tmp_path / "all_annotations.parquet")
+        seen = {}
+
+        class FakeManager:
+            def __init__(self, **kwargs):
+                seen.update(kwargs)
+
+            def to_pd(self):
+                return seen["cached_data"]
+
+        monkeypatch.setattr(manager, "ProteinAnnotationManager", FakeManager)
+        config = PipelineConfig(
+            methods=[MethodSpec("pca", 2)],
+            output_path=tmp_path,
+            keep_tmp=True,
+            intermediate_dir=tmp_path,
+            refetch_stages=frozenset({"taxonomy", "interpro"}),
+            annotations=["ec", "genus", "pfam"],
+        )
+        ReductionPipeline(config)._fetch_annotations(["A"])
+
+        assert list(seen["cached_data"].columns) == ["identifier", "ec"]
+        assert seen["sources_to_fetch"]["taxonomy"]
+        assert not seen["sources_to_fetch"]["uniprot"]
+
+
 # ---------------------------------------------------------------------------
 # merge_same_name_sets
 # ---------------------------------------------------------------------------
@@ -583,6 +733,136 @@ class TestRunWithOverriddenConfig:
         assert base.config == original
 
 
+class TestRunReductionBatch:
+    """Batched dispatch returns results in job order, each run under its own
+    effective config, with the float16 upcast shared across the batch."""
+
+    def test_results_follow_job_order_and_params(self):
+        seen = []
+
+        class FakeBase:
+            config = {"metric": "euclidean"}
+
+            def process_reduction(self, data, method, dims):
+                seen.append((method, dims, dict(self.config), data.dtype))
+                return {"name": f"{method}{dims}", "dimensions": dims}
+
+        data = np.zeros((3, 4), dtype=np.float16)
+        jobs = [
+            ("pca", 2, {"metric": "euclidean"}),
+            ("umap", 3, {"metric": "cosine"}),
+        ]
+        results = _run_reduction_batch(FakeBase(), data, jobs, label="prot_t5")
+
+        assert [r["name"] for r in results] == ["pca2", "umap3"]
+        assert [s[2]["metric"] for s in seen] == ["euclidean", "cosine"]
+        assert all(s[3] == np.float32 for s in seen)
+
+    def test_empty_batch(self):
+        assert _run_reduction_batch(None, np.zeros((2, 2)), []) == []
+
+    def test_fully_cached_run_skips_upcast(self, tmp_path):
+        """A rerun with every projection cached must not copy float16 to float32."""
+
+        class NoUpcast(np.ndarray):
+            def astype(self, *args, **kwargs):
+                raise AssertionError("upcast copy made for a fully cached run")
+
+        config = PipelineConfig(
+            methods=[MethodSpec("pca", 2)],
+            output_path=tmp_path,
+            keep_tmp=True,
+            intermediate_dir=tmp_path,
+        )
+        data = np.random.default_rng(0).standard_normal((20, 8)).astype(np.float16)
+        headers = [f"P{i}" for i in range(20)]
+        pipeline = ReductionPipeline(config)
+        (first,) = pipeline._run_reductions([EmbeddingSet("prot_t5", data, headers)])
+
+        cached_set = EmbeddingSet("prot_t5", data.view(NoUpcast), headers)
+        (again,) = pipeline._run_reductions([cached_set])
+
+        np.testing.assert_array_equal(again["data"], first["data"])
+
+    def test_process_pool_matches_sequential(self):
+        from dataclasses import asdict
+
+        from protspace.data.processors.base_processor import BaseProcessor
+        from protspace.data.processors.pipeline import ReducerParams
+        from protspace.utils import get_reducers
+
+        params = asdict(ReducerParams())
+        base = BaseProcessor(params, get_reducers())
+        data = np.random.default_rng(0).normal(size=(30, 8)).astype(np.float32)
+        # Different params, so both are fitted rather than one sliced
+        jobs = [("pca", 2, params), ("pca", 3, {**params, "random_state": 7})]
+
+        sequential = _run_reduction_batch(base, data, jobs)
+        parallel = _run_reduction_batch(base, data, jobs, max_workers=2)
+
+        for seq, par in zip(sequential, parallel, strict=True):
+            assert par["dimensions"] == seq["dimensions"]
+            np.testing.assert_allclose(par["data"], seq["data"], atol=1e-5)
+        assert base.config == params
+
+    def test_worker_caps_blas_and_numba_threads(self, monkeypatch):
+        """Each pool worker caps numba's pool too, not just BLAS/OpenMP."""
+        from multiprocessing import shared_memory
+
+        import numba
+        import threadpoolctl
+
+        from protspace.data.processors import pipeline
+
+        calls = {}
+        monkeypatch.setattr(
+            threadpoolctl, "threadpool_limits", lambda n: calls.update(blas=n)
+        )
+        monkeypatch.setattr(numba, "set_num_threads", lambda n: calls.update(numba=n))
+        for name in ("_worker_base", "_worker_data", "_worker_shm"):
+            monkeypatch.setattr(pipeline, name, None)
+        shm = shared_memory.SharedMemory(create=True, size=32)
+        try:
+            pipeline._init_reduction_worker(None, shm.name, (4, 2), "<f4", 1)
+            assert calls == {"blas": 1, "numba": 1}
+            assert not pipeline._worker_data.flags.writeable
+        finally:
+            pipeline._worker_data = None
+            if pipeline._worker_shm is not None:
+                pipeline._worker_shm.close()
+            shm.close()
+            shm.unlink()
+
+    def test_narrower_pca_is_sliced_from_wider(self):
+        from dataclasses import asdict
+
+        from protspace.data.processors.base_processor import BaseProcessor
+        from protspace.data.processors.pipeline import ReducerParams
+        from protspace.utils import get_reducers
+
+        params = asdict(ReducerParams())
+        base = BaseProcessor(params, get_reducers())
+        data = np.random.default_rng(0).normal(size=(40, 8)).astype(np.float32)
+        fitted = []
+        process_reduction = base.process_reduction
+
+        def counting(data, method, dims):
+            fitted.append((method, dims))
+            return process_reduction(data, method, dims)
+
+        base.process_reduction = counting
+        pca2, pca3 = _run_reduction_batch(
+            base, data, [("pca", 2, params), ("pca", 3, params)]
+        )
+        (alone,) = _run_reduction_batch(base, data, [("pca", 2, params)])
+
+        assert fitted == [("pca", 3), ("pca", 2)]
+        assert pca2["dimensions"] == 2 and pca3["dimensions"] == 3
+        assert pca2["info"]["n_components"] == 2
+        assert len(pca2["info"]["explained_variance_ratio"]) == 2
+        np.testing.assert_allclose(pca2["data"], alone["data"], atol=1e-4)
+
+
 # ---------------------------------------------------------------------------
 # precomputed-MDS branch: base.config isolation
 # ---------------------------------------------------------------------------
@@ -0,0 +1,67 @@
+"""Tests for the ``protspace prepare`` command and its helpers."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from protspace.cli.app import app
+from protspace.cli.prepare import _dump_cache
+
+
+def _write_cache(path):
+    table = pa.table(
+        {
+            "identifier": ["A", "B", "C"],
+            "ec": ["1.1", None, "2"],
+            "length": pa.array([10, 20, None], pa.int64()),
+        }
+    )
+    pq.write_table(table, path)
+    return path
+
+
+def test_dump_cache_streams_batches_as_one_csv(tmp_path, capsys):
+    _dump_cache(_write_cache(tmp_path / "all_annotations.parquet"), batch_size=2)
+    assert capsys.readouterr().out == ("identifier,ec,length\nA,1.1,10\nB,,20\nC,2,\n")
+
+
+def test_dump_cache_empty_table_prints_header(tmp_path, capsys):
+    path = tmp_path / "all_annotations.parquet"
+    pq.write_table(pa.table({"identifier": pa.array([], pa.string())}), path)
+    _dump_cache(path)
+    assert capsys.readouterr().out == "identifier\n"
+
+
+def test_dump_cache_projects_columns(tmp_path, capsys):
+    path = _write_cache(tmp_path / "all_annotations.parquet")
+    _dump_cache(path, columns=["identifier", "length"])
+    assert capsys.readouterr().out == "identifier,length\nA,10\nB,20\nC,\n"
+
+
+def test_dump_cache_rejects_unknown_columns(tmp_path):
+    path = _write_cache(tmp_path / "all_annotations.parquet")
+    with pytest.raises(typer.BadParameter, match="pfam"):
+        _dump_cache(path, columns=["identifier", "pfam"])
+
+
+def test_dump_cache_missing_file_raises_file_not_found(tmp_path):
+    # prepare relies on this instead of a separate exists() check
+    with pytest.raises(FileNotFoundError):
+        _dump_cache(tmp_path / "all_annotations.parquet")
+
+
+@pytest.mark.parametrize(
+    ("annotation", "message"),
+    [("ecc", "Unknown annotation 'ecc'"), ("missing.csv", "missing.csv")],
+)
+def test_bad_annotations_fail_before_any_work(tmp_path, annotation, message):
+    out = tmp_path / "out"
+    result = CliRunner().invoke(
+        app, ["prepare", "-q", "x", "-a", f"ec,{annotation}", "-o", str(out)]
+    )
+
+    assert result.exit_code != 0
+    assert message in result.output
+    assert not out.exists()
@@ -933,6 +933,41 @@ def test_kmeans_elbow_subsample_is_row_order_invariant_with_ids():
     assert m1 == m2  # per-id membership invariant to input row order
 
 
+@pytest.mark.parametrize(
+    "ids",
+    [
+        [f"p{i}" for i in range(400)],
+        list(range(400)),  # numeric order differs from str order
+        [i if i % 2 else f"p{i}" for i in range(400)],  # mixed → str array
+    ],
+)
+def test_kmeans_elbow_seed_matches_sorted_str_ids(ids, monkeypatch):
+    """The fit seed is id_seed over the str-sorted ids, whatever the id type."""
+    from protspace.stats._sampling import id_seed
+    from protspace.stats.cluster import kmeans_elbow as mod
+
+    seeds = []
+
+    def spy(*args, **kwargs):
+        seeds.append(id_seed(*args, **kwargs))
+        return seeds[-1]
+
+    monkeypatch.setattr(mod, "id_seed", spy)
+    X, _ = _blobs(n=400, centers=4, dim=2, seed=43)
+    mod.kmeans_elbow(X, ids=ids, rng_seed=42, max_fit_sample=100)
+
+    assert seeds == [id_seed(42, list(ids))]
+
+
+def test_id_seed_assume_sorted_matches_sorting_path():
+    """Pre-sorted callers may skip the re-sort; the seed must not change."""
+    from protspace.stats._sampling import id_seed
+
+    ids = [f"p{i}" for i in range(50)]
+    shuffled = [ids[i] for i in np.random.default_rng(0).permutation(50)]
+    assert id_seed(42, sorted(ids), assume_sorted=True) == id_seed(42, shuffled)
+
+
 def test_elbow_result_has_no_silhouette_optimal_k():
     """The write-only silhouette_optimal_k field/sweep was removed."""
     from dataclasses import fields
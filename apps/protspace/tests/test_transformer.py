@@ -208,6 +208,19 @@ class TestAnnotationTransformerTransform:
         assert result[0].annotations["custom_field"] == "custom_value"
         assert result[0].annotations["another_field"] == "another_value"
 
+    def test_transform_proteins_with_different_fields(self):
+        """Each protein is transformed on its own fields, not the first one's."""
+        transformer = AnnotationTransformer()
+        proteins = [
+            ProteinAnnotations(identifier="P1", annotations={"fragment": "yes"}),
+            ProteinAnnotations(identifier="P2", annotations={"signal_peptide": ""}),
+        ]
+
+        result = transformer.transform(proteins)
+
+        assert result[0].annotations == {"fragment": "yes"}
+        assert result[1].annotations == {"signal_peptide": "False"}
+
 
 class TestAnnotationTransformerTransformRow:
     """Test the transform_row() method."""